@@ -5,11 +5,27 @@ Provides helper functions for creating common AAS elements.
 """
 
 from basyx.aas import model
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+
+def _as_tuple(items: Optional[Sequence[Any]]) -> Tuple[Any, ...]:
+    """Return items as a tuple, reusing it when it already is one."""
+    if isinstance(items, tuple):
+        return items
+    return tuple(items) if items else ()
 
 
 class AASElementFactory:
-    """Factory for creating AAS elements with consistent patterns."""
+    """
+    Factory for creating AAS elements with consistent patterns.
+
+    Every call returns a new element: a basyx submodel element belongs to
+    exactly one parent namespace, so elements must not be cached or shared.
+    Descriptions and multi-language values are mutable mappings and are
+    created per element as well; only immutable references are reused.
+    """
+
+    __slots__ = ()
 
     @staticmethod
     def create_property(
@@ -322,11 +338,11 @@ class AASElementFactory:
     @staticmethod
     def create_operation(
         id_short: str,
-        input_vars: Optional[List[model.Property]] = None,
-        output_vars: Optional[List[model.Property]] = None,
-        inoutput_vars: Optional[List[model.Property]] = None,
+        input_vars: Optional[Sequence[model.Property]] = None,
+        output_vars: Optional[Sequence[model.Property]] = None,
+        inoutput_vars: Optional[Sequence[model.Property]] = None,
         semantic_id: Optional[model.ExternalReference] = None,
-        qualifiers: Optional[List[model.Qualifier]] = None,
+        qualifiers: Optional[Sequence[model.Qualifier]] = None,
         description: Optional[str] = None
     ) -> model.Operation:
         """
@@ -341,21 +357,24 @@ class AASElementFactory:
             qualifiers: Optional qualifiers
             description: Optional description
 
+        Variable and qualifier sequences passed as tuples are used as-is;
+        other sequences are copied into tuples.
+
         Returns:
             Operation element
         """
         kwargs = {
             'id_short': id_short,
-            'input_variable': tuple(input_vars) if input_vars else (),
-            'output_variable': tuple(output_vars) if output_vars else (),
-            'in_output_variable': tuple(inoutput_vars) if inoutput_vars else ()
+            'input_variable': _as_tuple(input_vars),
+            'output_variable': _as_tuple(output_vars),
+            'in_output_variable': _as_tuple(inoutput_vars)
         }
 
         if semantic_id:
             kwargs['semantic_id'] = semantic_id
 
         if qualifiers:
-            kwargs['qualifier'] = tuple(qualifiers)
+            kwargs['qualifier'] = _as_tuple(qualifiers)
 
         if description:
             kwargs['description'] = model.MultiLanguageTextType(
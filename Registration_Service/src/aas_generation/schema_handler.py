@@ -5,11 +5,18 @@ Handles loading and parsing JSON schemas for AAS generation.
 """
 
 import json
+import mmap
+import re
 import urllib.request
 from pathlib import Path
 from typing import Dict, Optional
 from basyx.aas import model
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # JSON Schema to AAS datatypes mapping
 SCHEMA_TYPE_TO_AAS_TYPE = {
@@ -21,6 +28,12 @@ SCHEMA_TYPE_TO_AAS_TYPE = {
     'object': model.datatypes.String,  # Objects serialized as JSON strings
 }
 
+# Schema URLs that may resolve to a file in the local MQTTSchemas folder
+_LOCAL_SCHEMA_RE = re.compile(r'(?:MQTTSchemas|schemas)/')
+
+# Local schema files above this size are memory-mapped when orjson is available
+_MMAP_THRESHOLD = 64 * 1024
+
 
 class SchemaHandler:
     """Handles loading and parsing JSON schemas."""
@@ -39,6 +52,8 @@ class SchemaHandler:
         else:
             self.project_root = project_root
         self._schema_cache: Dict[str, Dict] = {}
+        # Extracted data fields by schema URL, for loaded schemas only
+        self._data_fields_cache: Dict[str, Dict[str, Dict]] = {}
 
     def load_schema(self, schema_url: str) -> Optional[Dict]:
         """
@@ -57,7 +72,7 @@ class SchemaHandler:
         schema = None
 
         # Try to resolve from local MQTTSchemas folder first
-        if 'MQTTSchemas/' in schema_url or 'schemas/' in schema_url:
+        if _LOCAL_SCHEMA_RE.search(schema_url):
             schema = self._load_local_schema(schema_url)
 
         # If no local file found, try to fetch from URL
@@ -80,7 +95,7 @@ class SchemaHandler:
             Parsed schema or None
         """
         # Extract filename from URL
-        filename = schema_url.split('/')[-1]
+        filename = schema_url.rpartition('/')[2]
 
         # Look in common schema locations
         local_paths = [
@@ -90,14 +105,36 @@ class SchemaHandler:
         for local_path in local_paths:
             if local_path.exists():
                 try:
-                    with open(local_path, 'r') as f:
-                        return json.load(f)
+                    return self._read_json_file(local_path)
                 except Exception as e:
                     print(
                         f"Warning: Could not load schema from {local_path}: {e}")
 
         return None
 
+    @staticmethod
+    def _read_json_file(path: Path) -> Dict:
+        """
+        Parse a JSON file from raw bytes, skipping the text decoding layer.
+
+        Uses orjson when installed; large files are then memory-mapped so the
+        content is parsed without an intermediate copy.
+
+        Args:
+            path: Path to the JSON file
+
+        Returns:
+            Parsed JSON document
+        """
+        with open(path, 'rb') as f:
+            if orjson is None:
+                return json.loads(f.read())
+            if path.stat().st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            return orjson.loads(f.read())
+
     def _load_remote_schema(self, schema_url: str) -> Optional[Dict]:
         """
         Load schema from remote URL.
@@ -233,10 +270,17 @@ class SchemaHandler:
             schema_url: URL of the schema to extract fields from
 
         Returns:
-            Dictionary of field_name -> {type, description, default_value}
+            Dictionary of field_name -> {type, description, default_value}.
+            It is cached per schema URL and shared between calls, so callers
+            must not modify it.
         """
+        data_fields = self._data_fields_cache.get(schema_url)
+        if data_fields is not None:
+            return data_fields
+
         schema = self.load_schema(schema_url)
         if not schema:
+            # Like failed schema loads, missing fields are not cached
             return {}
 
         # Get all properties including from allOf
@@ -285,8 +329,10 @@ class SchemaHandler:
                 'default_value': default_value
             }
 
+        self._data_fields_cache[schema_url] = data_fields
         return data_fields
 
     def clear_cache(self):
-        """Clear the schema cache."""
+        """Clear the schema cache and the extracted data fields."""
         self._schema_cache.clear()
+        self._data_fields_cache.clear()
@@ -4,12 +4,16 @@ Semantic ID Factory
 Centralizes creation of semantic IDs and references for AAS elements.
 """
 
+import functools
+
 from basyx.aas import model
 from typing import List, Optional
 
 
 class SemanticIdFactory:
     """Factory for creating semantic IDs and references."""
+
+    __slots__ = ()
     
     # IDTA Semantic IDs (URL strings)
     _ASSET_INTERFACES = "https://admin-shell.io/idta/AssetInterfacesDescription/1/0"
@@ -148,10 +152,14 @@ class SemanticIdFactory:
         return self.create_external_reference(self._CAPABILITY_REALIZED_BY)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def create_external_reference(semantic_id: str) -> model.ExternalReference:
         """
         Create an external reference for a semantic ID.
         
+        References are immutable, so one instance per semantic ID is
+        cached and shared by every accessor property and caller.
+        
         Args:
             semantic_id: The semantic ID URL
             
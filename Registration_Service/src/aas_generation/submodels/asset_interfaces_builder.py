@@ -1,29 +1,204 @@
 """Asset Interfaces Description Submodel Builder for AAS generation."""
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from basyx.aas import model
 
+# Forms key holding a nested response description, also used as the
+# id_short of the response collection
+_RESPONSE = 'response'
 
+# id_short values of the fixed interface elements
+_ID_KEY, _ID_TITLE, _ID_SYNC, _ID_INPUT, _ID_OUTPUT, _ID_FORMS = (
+    "Key", "Title", "Synchronous", "input", "output", "Forms")
+
+
+def _opt(element) -> tuple:
+    """Return a one-element tuple for an element, or () when it is None."""
+    return (element,) if element is not None else ()
+
+
+def _as_str(value) -> str:
+    """Return value as a string, skipping the conversion for str values."""
+    return value if type(value) is str else str(value)
+
+
+def _property_field(factory, id_short: str, value_type, value) -> model.Property:
+    """Build a plain Property field."""
+    return factory.create_property(
+        id_short=id_short,
+        value=value,
+        value_type=value_type
+    )
+
+
+def _bool_field(factory, id_short: str, value_type, value) -> model.Property:
+    """Build a Boolean Property field from a bool or 'true'/'false' value."""
+    # YAML usually yields a native bool already; only strings need parsing
+    if type(value) is not bool:
+        value = _as_str(value).lower() == 'true'
+    return factory.create_property(
+        id_short=id_short,
+        value=value,
+        value_type=value_type
+    )
+
+
+def _file_field(factory, id_short: str, content_type, value) -> model.File:
+    """Build a File field referencing a schema."""
+    return factory.create_file(
+        id_short=id_short,
+        value=value,
+        content_type=content_type
+    )
+
+
+def _forms_field(factory, id_short: str, value_type,
+                 forms_config: Dict) -> Optional[model.SubmodelElementCollection]:
+    """Build a Forms collection with one string Property per form entry."""
+    create_property = factory.create_property
+    form_elements = [
+        create_property(
+            id_short=key,
+            value=_as_str(value),
+            value_type=value_type
+        )
+        for key, value in forms_config.items()
+    ]
+    if not form_elements:
+        return None
+    return factory.create_collection(id_short=id_short, elements=form_elements)
+
+
+def _action_forms_field(factory, id_short: str, value_type,
+                        forms_config: Dict) -> Optional[model.SubmodelElementCollection]:
+    """Build an action Forms collection, nesting a dict-valued response."""
+    create_property = factory.create_property
+    form_elements = []
+
+    for key, value in forms_config.items():
+        if key == _RESPONSE and type(value) is dict:
+            # Response is a nested structure
+            response_elements = [
+                create_property(
+                    id_short=resp_key,
+                    value=_as_str(resp_value),
+                    value_type=value_type
+                )
+                for resp_key, resp_value in value.items()
+            ]
+            if response_elements:
+                form_elements.append(
+                    factory.create_collection(
+                        id_short=_RESPONSE,
+                        elements=response_elements
+                    )
+                )
+        else:
+            form_elements.append(
+                create_property(
+                    id_short=key,
+                    value=_as_str(value),
+                    value_type=value_type
+                )
+            )
+
+    if not form_elements:
+        return None
+    return factory.create_collection(id_short=id_short, elements=form_elements)
+
+
+# Field kind -> builder. Every builder takes (factory, id_short, type, value)
+# and returns the element, or None when the field yields nothing.
+_FIELD_HANDLERS = {
+    'prop': _property_field,
+    'bool': _bool_field,
+    'file': _file_field,
+    'forms': _forms_field,
+    'action_forms': _action_forms_field,
+}
+
+
+@dataclass(slots=True, eq=False)
 class AssetInterfacesBuilder:
     """
     Builder class for creating AssetInterfacesDescription submodel.
 
     This submodel describes the communication interfaces of an asset,
     primarily MQTT-based interfaces following W3C Thing Description patterns.
+
+    Attributes:
+        base_url: Base URL for AAS identifiers
+        semantic_factory: SemanticIdFactory instance for semantic IDs
+        element_factory: AASElementFactory instance for element creation
     """
 
-    def __init__(self, base_url: str, semantic_factory, element_factory):
+    _STRING = model.datatypes.String
+    _BOOLEAN = model.datatypes.Boolean
+    _JSON_SCHEMA_CT = "application/schema+json"
+
+    # Field tables: (config key, id_short, type, kind). The kind selects the
+    # builder in _FIELD_HANDLERS; type is the value type, or the content type
+    # for 'file' fields. Table order is the element order of the output.
+    _ENDPOINT_FIELDS = (
+        ('base', 'base', _STRING, 'prop'),
+        ('contentType', 'contentType', _STRING, 'prop'),
+    )
+    _ACTION_FIELDS = (
+        ('key', _ID_KEY, _STRING, 'prop'),
+        ('title', _ID_TITLE, _STRING, 'prop'),
+        ('synchronous', _ID_SYNC, _BOOLEAN, 'bool'),
+        ('input', _ID_INPUT, _JSON_SCHEMA_CT, 'file'),
+        ('output', _ID_OUTPUT, _JSON_SCHEMA_CT, 'file'),
+        ('forms', _ID_FORMS, _STRING, 'action_forms'),
+    )
+    _PROPERTY_FIELDS = (
+        ('key', _ID_KEY, _STRING, 'prop'),
+        ('title', _ID_TITLE, _STRING, 'prop'),
+        ('output', _ID_OUTPUT, _JSON_SCHEMA_CT, 'file'),
+        ('forms', _ID_FORMS, _STRING, 'forms'),
+    )
+
+    base_url: str
+    semantic_factory: Any
+    element_factory: Any
+
+    # Semantic IDs resolved from semantic_factory in __post_init__
+    _sid_submodel: model.ExternalReference = field(init=False, repr=False)
+    _sid_interface: model.ExternalReference = field(init=False, repr=False)
+    _sid_mqtt: model.ExternalReference = field(init=False, repr=False)
+    _sid_wot_td: model.ExternalReference = field(init=False, repr=False)
+    _sid_interaction: model.ExternalReference = field(init=False, repr=False)
+    _sid_wot_interaction: model.ExternalReference = field(init=False, repr=False)
+    _sid_wot_action: model.ExternalReference = field(init=False, repr=False)
+    _sid_wot_property: model.ExternalReference = field(init=False, repr=False)
+    # Submodel constructor arguments shared by every build
+    _submodel_template_kwargs: Dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self):
         """
-        Initialize the AssetInterfacesDescription submodel builder.
+        Resolve the semantic IDs used by the builder.
 
-        Args:
-            base_url: Base URL for AAS identifiers
-            semantic_factory: SemanticIdFactory instance for semantic IDs
-            element_factory: AASElementFactory instance for element creation
+        Semantic IDs are immutable references, so they are resolved once per
+        builder instead of on every build.
         """
-        self.base_url = base_url
-        self.semantic_factory = semantic_factory
-        self.element_factory = element_factory
+        sf = self.semantic_factory
+        self._sid_submodel = sf.ASSET_INTERFACES_DESCRIPTION
+        self._sid_interface = sf.INTERFACE
+        self._sid_mqtt = sf.MQTT_PROTOCOL
+        self._sid_wot_td = sf.WOT_THING_DESCRIPTION
+        self._sid_interaction = sf.INTERACTION_METADATA
+        self._sid_wot_interaction = sf.WOT_INTERACTION_AFFORDANCE
+        self._sid_wot_action = sf.WOT_ACTION_AFFORDANCE
+        self._sid_wot_property = sf.WOT_PROPERTY_AFFORDANCE
+
+        # Submodel arguments that are the same for every build; the
+        # mutable AdministrativeInformation is created per submodel
+        self._submodel_template_kwargs = dict(
+            id_short="AssetInterfacesDescription",
+            kind=model.ModellingKind.INSTANCE,
+            semantic_id=self._sid_submodel
+        )
 
     def build(self, system_id: str, config: Dict) -> model.Submodel:
         """
@@ -36,122 +211,142 @@ class AssetInterfacesBuilder:
         Returns:
             AssetInterfacesDescription submodel
         """
-        interface_config = config.get('AssetInterfacesDescription', {}) or {}
-        mqtt_config = interface_config.get('InterfaceMQTT', {}) or {}
+        interface_config = config.get('AssetInterfacesDescription')
+        mqtt_config = interface_config.get(
+            'InterfaceMQTT') if interface_config else None
+        if not mqtt_config:
+            return self._build_empty_submodel(system_id)
 
-        # Create MQTT interface collection
-        interface_elements = []
+        create_property = self.element_factory.create_property
+        create_collection = self.element_factory.create_collection
+        String = self._STRING
+        mqtt_get = mqtt_config.get
 
         # Title (lowercase to match W3C Thing Description)
-        title = mqtt_config.get('Title', system_id)
-        interface_elements.append(
-            self.element_factory.create_property(
-                id_short="title",
-                value=title,
-                value_type=model.datatypes.String
-            )
+        title = create_property(
+            id_short="title",
+            value=mqtt_get('Title', system_id),
+            value_type=String
         )
 
-        # Add EndpointMetadata collection with MQTT topics
-        endpoint_metadata = self._create_mqtt_endpoint_metadata(mqtt_config)
-        if endpoint_metadata:
-            interface_elements.append(endpoint_metadata)
+        # EndpointMetadata collection with MQTT topics
+        endpoint_metadata = None
+        endpoint_config = mqtt_get('EndpointMetadata', {})
+        if endpoint_config:
+            endpoint_elements = self._create_fields(
+                endpoint_config, self._ENDPOINT_FIELDS)
+            if endpoint_elements:
+                endpoint_metadata = create_collection(
+                    id_short="EndpointMetadata",
+                    elements=endpoint_elements
+                )
 
         # Create InteractionMetadata collection with actions and properties nested
-        interaction_metadata = mqtt_config.get('InteractionMetadata', {})
-        interaction_elements = []
-
-        actions = interaction_metadata.get('actions', [])
-        if actions:
-            actions_collection = self._create_actions_from_interaction_metadata(
-                actions)
-            if actions_collection:
-                interaction_elements.append(actions_collection)
-
-        properties = interaction_metadata.get('properties', [])
-        if properties:
-            properties_collection = self._create_properties_from_interaction_metadata(
-                properties)
-            if properties_collection:
-                interaction_elements.append(properties_collection)
+        interaction_metadata = mqtt_get('InteractionMetadata', {})
+        interaction_get = interaction_metadata.get
+        interaction_elements = [
+            collection for collection in (
+                self._create_actions_from_interaction_metadata(
+                    interaction_get('actions', [])),
+                self._create_properties_from_interaction_metadata(
+                    interaction_get('properties', [])),
+            ) if collection
+        ]
 
         # Wrap in InteractionMetadata collection if we have content
+        interaction_metadata_collection = None
         if interaction_elements:
-            interaction_metadata_collection = self.element_factory.create_collection(
+            interaction_metadata_collection = create_collection(
                 id_short="InteractionMetadata",
                 elements=interaction_elements,
-                semantic_id=self.semantic_factory.INTERACTION_METADATA,
+                semantic_id=self._sid_interaction,
                 supplemental_semantic_ids=[
-                    self.semantic_factory.WOT_INTERACTION_AFFORDANCE
+                    self._sid_wot_interaction
                 ]
             )
-            interface_elements.append(interaction_metadata_collection)
 
+        interface_elements = (
+            title,
+            *_opt(endpoint_metadata),
+            *_opt(interaction_metadata_collection),
+        )
+
+        return self._create_submodel(system_id, interface_elements)
+
+    def _build_empty_submodel(self, system_id: str) -> model.Submodel:
+        """
+        Create the submodel for an asset without an MQTT interface description.
+
+        The InterfaceMQTT collection only carries the title, which defaults
+        to the system ID.
+
+        Args:
+            system_id: Unique identifier for the system
+
+        Returns:
+            AssetInterfacesDescription submodel
+        """
+        title = self.element_factory.create_property(
+            id_short="title",
+            value=system_id,
+            value_type=self._STRING
+        )
+        return self._create_submodel(system_id, [title])
+
+    def _create_submodel(self, system_id: str,
+                         interface_elements: Sequence[model.SubmodelElement]) -> model.Submodel:
+        """
+        Wrap the interface elements in InterfaceMQTT and the submodel.
+
+        Args:
+            system_id: Unique identifier for the system
+            interface_elements: Child elements of the InterfaceMQTT collection
+
+        Returns:
+            AssetInterfacesDescription submodel
+        """
         interface_mqtt = self.element_factory.create_collection(
             id_short="InterfaceMQTT",
             elements=interface_elements,
-            semantic_id=self.semantic_factory.INTERFACE,
+            semantic_id=self._sid_interface,
             supplemental_semantic_ids=[
-                self.semantic_factory.MQTT_PROTOCOL,
-                self.semantic_factory.WOT_THING_DESCRIPTION
+                self._sid_mqtt,
+                self._sid_wot_td
             ]
         )
 
-        submodel = model.Submodel(
+        return model.Submodel(
             id_=f"{self.base_url}/submodels/instances/{system_id}/AssetInterfacesDescription",
-            id_short="AssetInterfacesDescription",
-            kind=model.ModellingKind.INSTANCE,
-            semantic_id=self.semantic_factory.ASSET_INTERFACES_DESCRIPTION,
+            submodel_element=[interface_mqtt],
             administration=model.AdministrativeInformation(
                 version="1", revision="0"),
-            submodel_element=[interface_mqtt]
+            **self._submodel_template_kwargs
         )
 
-        return submodel
-
-    def _create_mqtt_endpoint_metadata(self, mqtt_config: Dict) -> Optional[model.SubmodelElementCollection]:
+    def _create_fields(self, cfg: Dict,
+                       fields: Tuple[tuple, ...]) -> List[model.SubmodelElement]:
         """
-        Create the EndpointMetadata collection for MQTT topics.
+        Create the elements for the fixed fields of a config section.
 
         Args:
-            mqtt_config: MQTT configuration dictionary
+            cfg: Configuration dictionary of the section
+            fields: Field table describing which keys to map and how
 
         Returns:
-            EndpointMetadata SubmodelElementCollection or None
+            Elements for the fields present in cfg, in table order
         """
-        endpoint_config = mqtt_config.get('EndpointMetadata', {})
-        if not endpoint_config:
-            return None
-
-        endpoint_elements = []
+        factory = self.element_factory
+        handlers = _FIELD_HANDLERS
+        elements = []
 
-        # Base endpoint
-        if 'base' in endpoint_config:
-            endpoint_elements.append(
-                self.element_factory.create_property(
-                    id_short="base",
-                    value=endpoint_config['base'],
-                    value_type=model.datatypes.String
-                )
-            )
+        # One pass over the field table, dispatching on field kind
+        for cfg_key, id_short, field_type, kind in fields:
+            if cfg_key in cfg:
+                element = handlers[kind](factory, id_short, field_type, cfg[cfg_key])
+                if element is not None:
+                    elements.append(element)
 
-        # Content type
-        if 'contentType' in endpoint_config:
-            endpoint_elements.append(
-                self.element_factory.create_property(
-                    id_short="contentType",
-                    value=endpoint_config['contentType'],
-                    value_type=model.datatypes.String
-                )
-            )
-
-        if not endpoint_elements:
-            return None
-
-        return self.element_factory.create_collection(
-            id_short="EndpointMetadata",
-            elements=endpoint_elements
-        )
+        return elements
 
     def _create_actions_from_interaction_metadata(self, actions: Dict) -> Optional[model.SubmodelElementCollection]:
         """
@@ -166,104 +361,16 @@ class AssetInterfacesBuilder:
         if not actions:
             return None
 
+        create_collection = self.element_factory.create_collection
         action_elements = []
 
         # Actions is a dict with action names as keys
         for action_name, action_config in actions.items():
+            action_props = self._create_fields(action_config, self._ACTION_FIELDS)
+            if not action_props:
+                continue
 
-            action_props = []
-
-            # Key/Title
-            if 'key' in action_config:
-                action_props.append(
-                    self.element_factory.create_property(
-                        id_short="Key",
-                        value=action_config['key'],
-                        value_type=model.datatypes.String
-                    )
-                )
-
-            if 'title' in action_config:
-                action_props.append(
-                    self.element_factory.create_property(
-                        id_short="Title",
-                        value=action_config['title'],
-                        value_type=model.datatypes.String
-                    )
-                )
-
-            # Synchronous flag
-            if 'synchronous' in action_config:
-                sync_value = str(
-                    action_config['synchronous']).lower() == 'true'
-                action_props.append(
-                    self.element_factory.create_property(
-                        id_short="Synchronous",
-                        value=sync_value,
-                        value_type=model.datatypes.Boolean
-                    )
-                )
-
-            # Input/Output schemas
-            if 'input' in action_config:
-                action_props.append(
-                    self.element_factory.create_file(
-                        id_short="input",
-                        value=action_config['input'],
-                        content_type="application/schema+json"
-                    )
-                )
-
-            if 'output' in action_config:
-                action_props.append(
-                    self.element_factory.create_file(
-                        id_short="output",
-                        value=action_config['output'],
-                        content_type="application/schema+json"
-                    )
-                )
-
-            # Forms
-            if 'forms' in action_config:
-                forms_config = action_config['forms']
-                form_elements = []
-
-                for key, value in forms_config.items():
-                    if key == 'response' and isinstance(value, dict):
-                        # Response is a nested structure
-                        response_elements = []
-                        for resp_key, resp_value in value.items():
-                            response_elements.append(
-                                self.element_factory.create_property(
-                                    id_short=resp_key,
-                                    value=str(resp_value),
-                                    value_type=model.datatypes.String
-                                )
-                            )
-                        form_elements.append(
-                            self.element_factory.create_collection(
-                                id_short="response",
-                                elements=response_elements
-                            )
-                        )
-                    else:
-                        form_elements.append(
-                            self.element_factory.create_property(
-                                id_short=key,
-                                value=str(value),
-                                value_type=model.datatypes.String
-                            )
-                        )
-
-                if form_elements:
-                    action_props.append(
-                        self.element_factory.create_collection(
-                            id_short="Forms",
-                            elements=form_elements
-                        )
-                    )
-
-            action_element = self.element_factory.create_collection(
+            action_element = create_collection(
                 id_short=action_name,
                 elements=action_props
             )
@@ -272,10 +379,10 @@ class AssetInterfacesBuilder:
         if not action_elements:
             return None
 
-        return self.element_factory.create_collection(
+        return create_collection(
             id_short="actions",
             elements=action_elements,
-            semantic_id=self.semantic_factory.WOT_ACTION_AFFORDANCE
+            semantic_id=self._sid_wot_action
         )
 
     def _create_properties_from_interaction_metadata(self, properties: Dict) -> Optional[model.SubmodelElementCollection]:
@@ -291,65 +398,16 @@ class AssetInterfacesBuilder:
         if not properties:
             return None
 
+        create_collection = self.element_factory.create_collection
         property_elements = []
 
         # Properties is a dict with property names as keys
         for prop_name, prop_config in properties.items():
+            prop_elements = self._create_fields(prop_config, self._PROPERTY_FIELDS)
+            if not prop_elements:
+                continue
 
-            prop_elements = []
-
-            # Key/Title
-            if 'key' in prop_config:
-                prop_elements.append(
-                    self.element_factory.create_property(
-                        id_short="Key",
-                        value=prop_config['key'],
-                        value_type=model.datatypes.String
-                    )
-                )
-
-            if 'title' in prop_config:
-                prop_elements.append(
-                    self.element_factory.create_property(
-                        id_short="Title",
-                        value=prop_config['title'],
-                        value_type=model.datatypes.String
-                    )
-                )
-
-            # Output schema
-            if 'output' in prop_config:
-                prop_elements.append(
-                    self.element_factory.create_file(
-                        id_short="output",
-                        value=prop_config['output'],
-                        content_type="application/schema+json"
-                    )
-                )
-
-            # Forms
-            if 'forms' in prop_config:
-                forms_config = prop_config['forms']
-                form_elements = []
-
-                for key, value in forms_config.items():
-                    form_elements.append(
-                        self.element_factory.create_property(
-                            id_short=key,
-                            value=str(value),
-                            value_type=model.datatypes.String
-                        )
-                    )
-
-                if form_elements:
-                    prop_elements.append(
-                        self.element_factory.create_collection(
-                            id_short="Forms",
-                            elements=form_elements
-                        )
-                    )
-
-            property_element = self.element_factory.create_collection(
+            property_element = create_collection(
                 id_short=prop_name,
                 elements=prop_elements
             )
@@ -358,8 +416,8 @@ class AssetInterfacesBuilder:
         if not property_elements:
             return None
 
-        return self.element_factory.create_collection(
+        return create_collection(
             id_short="properties",
             elements=property_elements,
-            semantic_id=self.semantic_factory.WOT_PROPERTY_AFFORDANCE
+            semantic_id=self._sid_wot_property
         )
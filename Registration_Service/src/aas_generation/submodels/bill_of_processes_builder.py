@@ -5,10 +5,81 @@ which defines the ordered sequence of production steps with their
 semantic IDs for capability matching.
 """
 
-from typing import Dict, List, Any, Optional
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple, Callable, Iterator, Mapping
 from basyx.aas import model
 
 
+# Value types resolved once at import time
+_String = model.datatypes.String
+_Int = model.datatypes.Int
+_Float = model.datatypes.Float
+
+# Shared read-only default for missing config sections
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
+# Python scalar type -> AAS value type, looked up by exact type so that
+# bool is not mistaken for its int base class
+_PY_TO_AAS = {
+    bool: model.datatypes.Boolean,
+    int: _Int,
+    float: _Float,
+    str: _String,
+}
+
+
+def _as_float(value: Any) -> float:
+    """Return value as a float, skipping the conversion for float values."""
+    return value if type(value) is float else float(value)
+
+
+# Requirement field tables: (config key, id_short, value type, conversion).
+# Fields are emitted in table order when their key is present in the config.
+_FieldTable = Tuple[Tuple[str, str, type, Any], ...]
+
+_REQ_FIELDS: _FieldTable = (
+    ('unit', 'Unit', _String, None),
+    ('tolerance', 'Tolerance', _Float, _as_float),
+)
+_RATE_FIELDS: _FieldTable = (
+    ('rate', 'Rate', _Float, _as_float),
+    ('unit', 'Unit', _String, None),
+    ('appliesTo', 'AppliesTo', _String, None),
+    ('description', 'Description', _String, None),
+)
+
+
+def _append_field_properties(
+    config: Dict[str, Any],
+    fields: _FieldTable,
+    elements: List[model.SubmodelElement]
+) -> List[model.SubmodelElement]:
+    """
+    Append a Property for every field of a table present in the config.
+
+    Args:
+        config: Requirement configuration
+        fields: Field table describing which keys to map and how
+        elements: List the properties are appended to
+
+    Returns:
+        The elements list
+    """
+    Property = model.Property
+    for key, id_short, value_type, convert in fields:
+        if key in config:
+            value = config[key]
+            elements.append(
+                Property(
+                    id_short=id_short,
+                    value_type=value_type,
+                    value=convert(value) if convert is not None else value
+                )
+            )
+    return elements
+
+
 class BillOfProcessesSubmodelBuilder:
     """
     Builder class for creating BillOfProcesses submodel.
@@ -18,11 +89,14 @@ class BillOfProcessesSubmodelBuilder:
     has a semantic ID that can be matched to resource capabilities.
     """
     
+    __slots__ = ('base_url', 'semantic_factory', 'element_factory')
+    
     # Semantic IDs
     BILL_OF_PROCESSES_SEMANTIC_ID = "https://smartproductionlab.aau.dk/submodels/BillOfProcesses/1/0"
     PROCESS_STEP_SEMANTIC_ID = "https://smartproductionlab.aau.dk/submodels/ProcessStep/1/0"
+    PROCESS_LIST_SEMANTIC_ID = "https://smartproductionlab.aau.dk/submodels/ProcessList/1/0"
     
-    def __init__(self, base_url: str, semantic_factory, element_factory):
+    def __init__(self, base_url: str, semantic_factory: Any, element_factory: Any) -> None:
         """
         Initialize the BillOfProcesses submodel builder.
         
@@ -35,7 +109,7 @@ class BillOfProcessesSubmodelBuilder:
         self.semantic_factory = semantic_factory
         self.element_factory = element_factory
     
-    def build(self, system_id: str, config: Dict) -> model.Submodel:
+    def build(self, system_id: str, config: Dict[str, Any]) -> model.Submodel:
         """
         Create the BillOfProcesses submodel.
         
@@ -58,49 +132,60 @@ class BillOfProcessesSubmodelBuilder:
         Returns:
             BillOfProcesses submodel instance
         """
-        bop_config = config.get('BillOfProcesses', {}) or {}
-        processes = bop_config.get('Processes', [])
-        
-        # Create process step elements
-        process_elements = []
-        
-        for process_entry in processes:
-            if isinstance(process_entry, dict):
-                for process_name, process_config in process_entry.items():
-                    if isinstance(process_config, dict):
-                        step_element = self._create_process_step(
-                            process_name, process_config
-                        )
-                        process_elements.append(step_element)
+        bop_config = config.get('BillOfProcesses') or _EMPTY_DICT
+        processes = bop_config.get('Processes') or ()
         
         # Create the Processes list
         processes_list = model.SubmodelElementList(
             id_short="Processes",
             type_value_list_element=model.SubmodelElementCollection,
-            value=process_elements,
-            semantic_id=self._create_semantic_reference(
-                "https://smartproductionlab.aau.dk/submodels/ProcessList/1/0"
+            # Steps are streamed straight into the list's namespace set
+            value=self._iter_process_steps(processes),
+            semantic_id=self.semantic_factory.create_external_reference(
+                self.PROCESS_LIST_SEMANTIC_ID
             )
         )
         
-        # Create submodel semantic ID
-        semantic_id_value = bop_config.get('semantic_id', self.BILL_OF_PROCESSES_SEMANTIC_ID)
+        # Create submodel semantic ID, unless overridden by the config
+        submodel_semantic_id = self.semantic_factory.create_external_reference(
+            bop_config.get('semantic_id', self.BILL_OF_PROCESSES_SEMANTIC_ID)
+        )
         
         submodel = model.Submodel(
             id_=f"{self.base_url}/submodels/instances/{system_id}/BillOfProcesses",
             id_short="BillOfProcesses",
             kind=model.ModellingKind.INSTANCE,
-            semantic_id=self._create_semantic_reference(semantic_id_value),
+            semantic_id=submodel_semantic_id,
             administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=[processes_list]
         )
         
         return submodel
     
+    def _iter_process_steps(
+        self,
+        processes: List[Any]
+    ) -> Iterator[model.SubmodelElementCollection]:
+        """
+        Create the process step elements for every process in the config.
+        
+        Args:
+            processes: Processes list of the BillOfProcesses config
+            
+        Returns:
+            Lazy iterator over the process step elements, in list order
+        """
+        return (
+            self._create_process_step(process_name, process_config)
+            for process_entry in processes if isinstance(process_entry, dict)
+            for process_name, process_config in process_entry.items()
+            if isinstance(process_config, dict)
+        )
+    
     def _create_process_step(
         self, 
         process_name: str, 
-        process_config: Dict
+        process_config: Dict[str, Any]
     ) -> model.SubmodelElementCollection:
         """
         Create a process step element.
@@ -116,25 +201,30 @@ class BillOfProcessesSubmodelBuilder:
         Returns:
             SubmodelElementCollection representing the process step
         """
-        elements = []
+        Property = model.Property
+        Collection = model.SubmodelElementCollection
+        elements: List[model.SubmodelElement] = []
         
         # Step number
         step_num = process_config.get('step', 0)
         elements.append(
-            model.Property(
+            Property(
                 id_short="Step",
-                value_type=model.datatypes.Int,
+                value_type=_Int,
                 value=step_num
             )
         )
         
         # Semantic ID as property (for easy querying)
         semantic_id = process_config.get('semantic_id', '')
+        if type(semantic_id) is str and semantic_id:
+            # Process type URIs recur across steps and products
+            semantic_id = sys.intern(semantic_id)
         if semantic_id:
             elements.append(
-                model.Property(
+                Property(
                     id_short="SemanticId",
-                    value_type=model.datatypes.String,
+                    value_type=_String,
                     value=semantic_id
                 )
             )
@@ -143,9 +233,9 @@ class BillOfProcessesSubmodelBuilder:
         description = process_config.get('description', '')
         if description:
             elements.append(
-                model.Property(
+                Property(
                     id_short="Description",
-                    value_type=model.datatypes.String,
+                    value_type=_String,
                     value=description
                 )
             )
@@ -154,67 +244,53 @@ class BillOfProcessesSubmodelBuilder:
         duration = process_config.get('estimatedDuration', 0.0)
         if duration:
             elements.append(
-                model.Property(
+                Property(
                     id_short="EstimatedDuration",
-                    value_type=model.datatypes.Float,
-                    value=float(duration)
+                    value_type=_Float,
+                    value=_as_float(duration)
                 )
             )
         
         # Parameters as nested collection
-        parameters = process_config.get('parameters', {})
+        parameters = process_config.get('parameters')
         if parameters:
-            param_elements = []
+            value_type_of = _PY_TO_AAS.get
+            param_elements: List[model.SubmodelElement] = []
             for param_name, param_value in parameters.items():
-                # Determine value type
-                if isinstance(param_value, bool):
-                    value_type = model.datatypes.Boolean
-                elif isinstance(param_value, int):
-                    value_type = model.datatypes.Int
-                elif isinstance(param_value, float):
-                    value_type = model.datatypes.Float
-                else:
-                    value_type = model.datatypes.String
+                # Determine value type, falling back to a string value
+                value_type = value_type_of(type(param_value), _String)
+                if value_type is _String and type(param_value) is not str:
                     param_value = str(param_value)
                 
                 param_elements.append(
-                    model.Property(
+                    Property(
                         id_short=param_name,
                         value_type=value_type,
                         value=param_value
                     )
                 )
             
-            if param_elements:
-                elements.append(
-                    model.SubmodelElementCollection(
-                        id_short="Parameters",
-                        value=param_elements
-                    )
+            # A non-empty parameters mapping always yields elements
+            elements.append(
+                Collection(
+                    id_short="Parameters",
+                    value=param_elements
                 )
+            )
         
         # Create collection with semantic ID from process config
         # AASd-120: Items in SubmodelElementList must NOT have id_short
         # The process is identified by displayName (valid Referable attribute) and semanticId
         collection_semantic_id = None
         if semantic_id:
-            collection_semantic_id = self._create_semantic_reference(semantic_id)
+            collection_semantic_id = self.semantic_factory.create_external_reference(semantic_id)
         
-        return model.SubmodelElementCollection(
+        return Collection(
             id_short=None,
             display_name=model.MultiLanguageNameType({"en": process_name}),
             value=elements,
             semantic_id=collection_semantic_id
         )
-    
-    def _create_semantic_reference(self, semantic_id: str) -> model.ExternalReference:
-        """Create an external reference for a semantic ID"""
-        return model.ExternalReference(
-            (model.Key(
-                type_=model.KeyTypes.GLOBAL_REFERENCE,
-                value=semantic_id
-            ),)
-        )
 
 
 class RequirementsSubmodelBuilder:
@@ -227,9 +303,11 @@ class RequirementsSubmodelBuilder:
     - Quality control specifications
     """
     
+    __slots__ = ('base_url', 'semantic_factory', 'element_factory')
+    
     REQUIREMENTS_SEMANTIC_ID = "https://smartproductionlab.aau.dk/submodels/Requirements/1/0"
     
-    def __init__(self, base_url: str, semantic_factory, element_factory):
+    def __init__(self, base_url: str, semantic_factory: Any, element_factory: Any) -> None:
         """
         Initialize the Requirements submodel builder.
         
@@ -242,7 +320,7 @@ class RequirementsSubmodelBuilder:
         self.semantic_factory = semantic_factory
         self.element_factory = element_factory
     
-    def build(self, system_id: str, config: Dict) -> model.Submodel:
+    def build(self, system_id: str, config: Dict[str, Any]) -> model.Submodel:
         """
         Create the Requirements submodel.
         
@@ -253,208 +331,124 @@ class RequirementsSubmodelBuilder:
         Returns:
             Requirements submodel instance
         """
-        req_config = config.get('Requirements', {}) or {}
-        
-        submodel_elements = []
+        req_config = config.get('Requirements') or _EMPTY_DICT
+        submodel_elements: List[model.SubmodelElement] = []
         
         # Environmental requirements
-        env_config = req_config.get('Environmental', {})
+        env_config = req_config.get('Environmental')
         if env_config:
-            env_collection = self._create_environmental_collection(env_config)
+            env_collection = self._create_requirement_group(
+                env_config, "Environmental", self._create_requirement_elements
+            )
             submodel_elements.append(env_collection)
         
         # In-process control requirements
-        ipc_config = req_config.get('InProcessControl', {})
+        ipc_config = req_config.get('InProcessControl')
         if ipc_config:
-            ipc_collection = self._create_ipc_collection(ipc_config)
+            ipc_collection = self._create_requirement_group(
+                ipc_config, "InProcessControl", self._create_rate_requirement_elements
+            )
             submodel_elements.append(ipc_collection)
         
         # Quality control requirements
-        qc_config = req_config.get('QualityControl', {})
+        qc_config = req_config.get('QualityControl')
         if qc_config:
-            qc_collection = self._create_qc_collection(qc_config)
+            qc_collection = self._create_requirement_group(
+                qc_config, "QualityControl", self._create_qc_requirement_elements
+            )
             submodel_elements.append(qc_collection)
         
-        semantic_id_value = req_config.get('semantic_id', self.REQUIREMENTS_SEMANTIC_ID)
+        submodel_semantic_id = self.semantic_factory.create_external_reference(
+            req_config.get('semantic_id', self.REQUIREMENTS_SEMANTIC_ID)
+        )
         
         submodel = model.Submodel(
             id_=f"{self.base_url}/submodels/instances/{system_id}/Requirements",
             id_short="Requirements",
             kind=model.ModellingKind.INSTANCE,
-            semantic_id=self._create_semantic_reference(semantic_id_value),
+            semantic_id=submodel_semantic_id,
             administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=submodel_elements
         )
         
         return submodel
     
-    def _create_environmental_collection(self, config: Dict) -> model.SubmodelElementCollection:
-        """Create Environmental requirements collection"""
-        elements = []
-        
-        for req_name, req_config in config.items():
-            if isinstance(req_config, dict):
-                req_elements = self._create_requirement_elements(req_config)
-                elements.append(
-                    model.SubmodelElementCollection(
-                        id_short=req_name,
-                        value=req_elements,
-                        semantic_id=self._create_semantic_reference(
-                            req_config.get('semantic_id', '')
-                        ) if req_config.get('semantic_id') else None
-                    )
-                )
-        
-        return model.SubmodelElementCollection(
-            id_short="Environmental",
-            value=elements
-        )
-    
-    def _create_ipc_collection(self, config: Dict) -> model.SubmodelElementCollection:
-        """Create In-Process Control requirements collection"""
-        elements = []
-        
-        for req_name, req_config in config.items():
-            if isinstance(req_config, dict):
-                req_elements = self._create_rate_requirement_elements(req_config)
-                elements.append(
-                    model.SubmodelElementCollection(
-                        id_short=req_name,
-                        value=req_elements,
-                        semantic_id=self._create_semantic_reference(
-                            req_config.get('semantic_id', '')
-                        ) if req_config.get('semantic_id') else None
-                    )
-                )
+    def _create_requirement_group(
+        self,
+        config: Dict[str, Any],
+        id_short: str,
+        create_elements: Callable[[Dict[str, Any]], List[model.SubmodelElement]]
+    ) -> model.SubmodelElementCollection:
+        """
+        Create a requirements category collection.
         
-        return model.SubmodelElementCollection(
-            id_short="InProcessControl",
-            value=elements
-        )
-    
-    def _create_qc_collection(self, config: Dict) -> model.SubmodelElementCollection:
-        """Create Quality Control requirements collection"""
-        elements = []
+        Args:
+            config: Requirement name -> requirement config for the category
+            id_short: id_short of the category collection
+            create_elements: Builds the elements of a single requirement
+            
+        Returns:
+            SubmodelElementCollection with one collection per requirement
+        """
+        Collection = model.SubmodelElementCollection
+        create_reference = self.semantic_factory.create_external_reference
+        elements: List[model.SubmodelElement] = []
         
         for req_name, req_config in config.items():
-            if isinstance(req_config, dict):
-                req_elements = self._create_rate_requirement_elements(req_config)
-                
-                # Add sample size if present
-                if 'sampleSize' in req_config:
-                    req_elements.append(
-                        model.Property(
-                            id_short="SampleSize",
-                            value_type=model.datatypes.Int,
-                            value=req_config['sampleSize']
-                        )
-                    )
-                
+            if isinstance(req_config, dict) and req_config:
+                semantic_id = req_config.get('semantic_id')
                 elements.append(
-                    model.SubmodelElementCollection(
+                    Collection(
                         id_short=req_name,
-                        value=req_elements,
-                        semantic_id=self._create_semantic_reference(
-                            req_config.get('semantic_id', '')
-                        ) if req_config.get('semantic_id') else None
+                        value=create_elements(req_config),
+                        semantic_id=create_reference(
+                            semantic_id
+                        ) if semantic_id else None
                     )
                 )
         
-        return model.SubmodelElementCollection(
-            id_short="QualityControl",
+        return Collection(
+            id_short=id_short,
             value=elements
         )
     
-    def _create_requirement_elements(self, config: Dict) -> List:
+    def _create_requirement_elements(self, config: Dict[str, Any]) -> List[model.SubmodelElement]:
         """Create elements for a basic requirement"""
-        elements = []
+        Property = model.Property
+        elements: List[model.SubmodelElement] = []
         
         if 'value' in config:
             value = config['value']
-            if isinstance(value, (int, float)):
-                elements.append(
-                    model.Property(
-                        id_short="Value",
-                        value_type=model.datatypes.Float if isinstance(value, float) else model.datatypes.Int,
-                        value=value
-                    )
-                )
-            else:
-                elements.append(
-                    model.Property(
-                        id_short="Value",
-                        value_type=model.datatypes.String,
-                        value=str(value)
-                    )
-                )
-        
-        if 'unit' in config:
+            value_type = _PY_TO_AAS.get(type(value))
+            if value_type is None:
+                value_type = _String
+                value = str(value)
             elements.append(
-                model.Property(
-                    id_short="Unit",
-                    value_type=model.datatypes.String,
-                    value=config['unit']
+                Property(
+                    id_short="Value",
+                    value_type=value_type,
+                    value=value
                 )
             )
         
-        if 'tolerance' in config:
-            elements.append(
-                model.Property(
-                    id_short="Tolerance",
-                    value_type=model.datatypes.Float,
-                    value=float(config['tolerance'])
-                )
-            )
-        
-        return elements
+        return _append_field_properties(config, _REQ_FIELDS, elements)
     
-    def _create_rate_requirement_elements(self, config: Dict) -> List:
+    def _create_rate_requirement_elements(self, config: Dict[str, Any]) -> List[model.SubmodelElement]:
         """Create elements for a rate-based requirement"""
-        elements = []
-        
-        if 'rate' in config:
-            elements.append(
-                model.Property(
-                    id_short="Rate",
-                    value_type=model.datatypes.Float,
-                    value=float(config['rate'])
-                )
-            )
-        
-        if 'unit' in config:
-            elements.append(
-                model.Property(
-                    id_short="Unit",
-                    value_type=model.datatypes.String,
-                    value=config['unit']
-                )
-            )
-        
-        if 'appliesTo' in config:
-            elements.append(
-                model.Property(
-                    id_short="AppliesTo",
-                    value_type=model.datatypes.String,
-                    value=config['appliesTo']
-                )
-            )
+        return _append_field_properties(config, _RATE_FIELDS, [])
+    
+    def _create_qc_requirement_elements(self, config: Dict[str, Any]) -> List[model.SubmodelElement]:
+        """Create elements for a quality control requirement"""
+        elements = self._create_rate_requirement_elements(config)
         
-        if 'description' in config:
+        # Add sample size if present
+        if 'sampleSize' in config:
             elements.append(
                 model.Property(
-                    id_short="Description",
-                    value_type=model.datatypes.String,
-                    value=config['description']
+                    id_short="SampleSize",
+                    value_type=_Int,
+                    value=config['sampleSize']
                 )
             )
         
         return elements
-    
-    def _create_semantic_reference(self, semantic_id: str) -> model.ExternalReference:
-        """Create an external reference for a semantic ID"""
-        return model.ExternalReference(
-            (model.Key(
-                type_=model.KeyTypes.GLOBAL_REFERENCE,
-                value=semantic_id
-            ),)
-        )
@@ -1,8 +1,34 @@
 """Capabilities Submodel Builder for AAS generation."""
 
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Sequence
 from basyx.aas import model
 
+# Key types and id_shorts used in capability references
+_SM = model.KeyTypes.SUBMODEL
+_SMC = model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION
+_CAPSET = "CapabilitySet"
+
+# Value types of capability properties and ranges
+_DOUBLE = model.datatypes.Double
+_STRING = model.datatypes.String
+
+# Shared read-only default for missing or empty config sections
+_EMPTY_DICT = MappingProxyType({})
+
+
+def _as_list(value: Any) -> Sequence[Any]:
+    """
+    Normalize a config value that may be a single string or a list.
+
+    Args:
+        value: A string, a sequence of values, or a falsy value
+
+    Returns:
+        A one-element tuple for a string, the sequence itself, or an empty tuple
+    """
+    return (value,) if isinstance(value, str) else (value or ())
+
 
 class CapabilitiesSubmodelBuilder:
     """
@@ -36,52 +62,59 @@ class CapabilitiesSubmodelBuilder:
         Returns:
             Capabilities submodel instance
         """
-        capabilities = config.get('Capabilities', {}) or {}
+        capabilities = config.get('Capabilities') or _EMPTY_DICT
         capability_containers = []
 
+        # Submodel IDs referenced by every relationship, formatted once
+        submodel_id = f"{self.base_url}/submodels/instances/{system_id}/OfferedCapabilityDescription"
+        skills_submodel_id = f"{self.base_url}/submodels/instances/{system_id}/Skills"
+
+        create_container = self._create_capability_container
+
         # Handle dict format: Capabilities: { CapName: {...}, ... }
         for cap_name, cap_config in capabilities.items():
-            cap_config = cap_config or {}
-            container = self._create_capability_container(
-                system_id, cap_name, cap_config
+            cap_config = cap_config or _EMPTY_DICT
+            container = create_container(
+                submodel_id, skills_submodel_id, cap_name, cap_config
             )
             if container:
                 capability_containers.append(container)
 
         # Create CapabilitySet
         capability_set = self.element_factory.create_collection(
-            id_short="CapabilitySet",
+            id_short=_CAPSET,
             elements=capability_containers,
             semantic_id=self.semantic_factory.CAPABILITY_SET
         )
 
         # Create submodel
         submodel = model.Submodel(
-            id_=f"{self.base_url}/submodels/instances/{system_id}/OfferedCapabilityDescription",
+            id_=submodel_id,
             id_short="OfferedCapabilityDescription",
             kind=model.ModellingKind.INSTANCE,
             semantic_id=self.semantic_factory.CAPABILITIES_SUBMODEL,
-            administration=model.AdministrativeInformation(
-                version="1", revision="0"),
+            administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=[capability_set]
         )
 
         return submodel
 
-    def _create_capability_container(self, system_id: str, cap_name: str,
+    def _create_capability_container(self, submodel_id: str, skills_submodel_id: str,
+                                     cap_name: str,
                                      cap_config: Dict) -> model.SubmodelElementCollection:
         """
         Create a capability container with all its elements.
 
         Args:
-            system_id: System identifier
+            submodel_id: ID of the OfferedCapabilityDescription submodel
+            skills_submodel_id: ID of the Skills submodel
             cap_name: Name of the capability
             cap_config: Configuration for the capability
 
         Returns:
             SubmodelElementCollection representing the capability container
         """
-        container_elements = []
+        container_id_short = cap_config.get('id_short', cap_name + 'Container')
 
         # Add Capability element with semantic_id from config if specified
         # This enables capability matching based on semantic identifiers
@@ -93,113 +126,167 @@ class CapabilitiesSubmodelBuilder:
         else:
             capability_semantic_id = self.semantic_factory.CAPABILITY
         
-        container_elements.append(
-            self.element_factory.create_capability(
-                id_short=cap_name,
-                semantic_id=capability_semantic_id
-            )
+        capability_element = self.element_factory.create_capability(
+            id_short=cap_name,
+            semantic_id=capability_semantic_id
         )
 
         # Add Comment if present
+        comment_element = None
         if 'comment' in cap_config:
-            container_elements.append(
-                self.element_factory.create_multi_language_property(
-                    id_short="Comment",
-                    text=cap_config['comment']
-                )
+            comment_element = self.element_factory.create_multi_language_property(
+                id_short="Comment",
+                text=cap_config['comment']
             )
 
+        realized_by = cap_config.get('realizedBy')
+        relations = cap_config.get('relations')
+        properties = cap_config.get('properties')
+
+        # Reference to this capability's container, shared as first of all
+        # relationships; its keys are reused for references to siblings
+        capability_ref = model.ModelReference(
+            (model.Key(
+                type_=_SM,
+                value=submodel_id
+            ),
+                model.Key(
+                type_=_SMC,
+                value=_CAPSET
+            ),
+                model.Key(
+                type_=_SMC,
+                value=container_id_short
+            )),
+            model.SubmodelElementCollection
+        )
+
         # Add CapabilityRelations only if there are relations defined
         # This avoids "empty collection" warnings in BaSyx UI
-        capability_relations = cap_config.get('relations', [])
-        if capability_relations:
+        relations_element = None
+        if relations:
             relation_elements = self._create_capability_relations(
-                system_id, cap_name, cap_config, capability_relations
+                capability_ref, relations
             )
             if relation_elements:
-                container_elements.append(
-                    self.element_factory.create_collection(
-                        id_short="CapabilityRelations",
-                        elements=relation_elements,
-                        semantic_id=self.semantic_factory.CAPABILITY_RELATIONS
-                    )
+                relations_element = self.element_factory.create_collection(
+                    id_short="CapabilityRelations",
+                    elements=relation_elements,
+                    semantic_id=self.semantic_factory.CAPABILITY_RELATIONS
                 )
 
         # Add realizedBy relationships to skills
-        realized_by_list = self._create_realized_by_list(
-            system_id, cap_name, cap_config
-        )
-        if realized_by_list:
-            container_elements.append(realized_by_list)
+        realized_by_list = None
+        if realized_by:
+            realized_by_list = self._create_realized_by_list(
+                capability_ref, skills_submodel_id, realized_by
+            )
 
-        # Add PropertySet if present
-        property_set = self._create_property_set(cap_config)
-        if property_set:
-            container_elements.append(property_set)
+        # Add PropertySet if present, with one PropertyContainer per
+        # property that has a comment, a value or a range
+        property_set = None
+        if properties:
+            element_factory = self.element_factory
+            property_elements = []
+            for prop in properties:
+                prop_container_elements = []
+
+                # Add Comment if description is present and not empty
+                description = prop.get('description')
+                if description:
+                    prop_container_elements.append(
+                        element_factory.create_multi_language_property(
+                            id_short="Comment",
+                            text=description
+                        )
+                    )
 
-        # Create capability container
+                # Add Property value or range
+                if 'min' in prop and 'max' in prop:
+                    prop_container_elements.append(
+                        element_factory.create_range(
+                            id_short=prop['name'],
+                            min_value=float(prop['min']),
+                            max_value=float(prop['max']),
+                            value_type=_DOUBLE
+                        )
+                    )
+                elif 'value' in prop:
+                    prop_container_elements.append(
+                        element_factory.create_property(
+                            id_short=prop['name'],
+                            value=prop['value'],
+                            value_type=_STRING
+                        )
+                    )
+
+                if prop_container_elements:
+                    property_elements.append(
+                        element_factory.create_collection(
+                            id_short=f"PropertyContainer_{prop['name']}",
+                            elements=prop_container_elements
+                        )
+                    )
+
+            if property_elements:
+                property_set = element_factory.create_collection(
+                    id_short="PropertySet",
+                    elements=property_elements
+                )
+
+        # Create capability container from the elements that are present
+        container_elements = [
+            element for element in (
+                capability_element, comment_element, relations_element,
+                realized_by_list, property_set
+            )
+            if element is not None
+        ]
         return self.element_factory.create_collection(
-            id_short=cap_config.get('id_short', cap_name + 'Container'),
+            id_short=container_id_short,
             elements=container_elements,
             semantic_id=self.semantic_factory.CAPABILITY_CONTAINER,
             description=cap_config.get('description', '')
         )
 
-    def _create_realized_by_list(self, system_id: str, cap_name: str,
-                                 cap_config: Dict) -> Optional[model.SubmodelElementList]:
+    def _create_realized_by_list(self, capability_ref: model.ModelReference,
+                                 skills_submodel_id: str,
+                                 realized_by: Any) -> model.SubmodelElementList:
         """
         Create the realizedBy SubmodelElementList.
 
         Args:
-            system_id: System identifier
-            cap_name: Name of the capability
-            cap_config: Configuration for the capability
+            capability_ref: Reference to the capability container
+            skills_submodel_id: ID of the Skills submodel
+            realized_by: Skill name or list of skill names realizing the capability
 
         Returns:
-            SubmodelElementList of relationships to skills, or None if no realizedBy
+            SubmodelElementList of relationships to skills
         """
-        realized_by = cap_config.get('realizedBy')
-        if not realized_by:
-            return None
-
-        # Handle both single string and list of strings
-        if isinstance(realized_by, str):
-            skill_names = [realized_by]
-        else:
-            skill_names = realized_by
+        create_relationship = self.element_factory.create_relationship
+        Key = model.Key
+        ModelReference = model.ModelReference
+        SMC_CLS = model.SubmodelElementCollection
+        # Keys are immutable, so the Skills submodel key is shared
+        skills_key = Key(
+            type_=_SM,
+            value=skills_submodel_id
+        )
 
         realized_by_elements = []
-        for skill_name in skill_names:
+        for skill_name in _as_list(realized_by):
             # Create relationship element pointing to skill
             # id_short=None for SubmodelElementList items (constraint AASd-120)
-            rel_element = self.element_factory.create_relationship(
+            rel_element = create_relationship(
                 id_short=None,
-                first=model.ModelReference(
-                    (model.Key(
-                        type_=model.KeyTypes.SUBMODEL,
-                        value=f"{self.base_url}/submodels/instances/{system_id}/OfferedCapabilityDescription"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                        value="CapabilitySet"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                        value=cap_config.get(
-                            'id_short', cap_name + 'Container')
-                    )),
-                    model.SubmodelElementCollection
-                ),
-                second=model.ModelReference(
-                    (model.Key(
-                        type_=model.KeyTypes.SUBMODEL,
-                        value=f"{self.base_url}/submodels/instances/{system_id}/Skills"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
+                first=capability_ref,
+                second=ModelReference(
+                    (skills_key,
+                        Key(
+                        type_=_SMC,
                         value=skill_name
                     )),
-                    model.SubmodelElementCollection
+                    SMC_CLS
                 )
             )
             realized_by_elements.append(rel_element)
@@ -211,8 +298,7 @@ class CapabilitiesSubmodelBuilder:
             semantic_id=self.semantic_factory.CAPABILITY_REALIZED_BY
         )
 
-    def _create_capability_relations(self, system_id: str, cap_name: str,
-                                     cap_config: Dict,
+    def _create_capability_relations(self, capability_ref: model.ModelReference,
                                      relations: List[Any]) -> List[model.SubmodelElement]:
         """
         Create capability relation elements.
@@ -221,135 +307,41 @@ class CapabilitiesSubmodelBuilder:
         such as requires, isPartOf, isComposedOf, etc.
 
         Args:
-            system_id: System identifier
-            cap_name: Name of the capability
-            cap_config: Configuration for the capability
+            capability_ref: Reference to the capability container
             relations: List of relation configurations
 
         Returns:
             List of SubmodelElements representing the relations
         """
-        relation_elements = []
-        for idx, relation in enumerate(relations):
-            if not isinstance(relation, dict):
-                continue
-
-            relation_type = relation.get('type', 'requires')
-            target_capability = relation.get('target')
-
-            if not target_capability:
-                continue
+        create_relationship = self.element_factory.create_relationship
+        Key = model.Key
+        ModelReference = model.ModelReference
+        SMC_CLS = model.SubmodelElementCollection
+        # Submodel and CapabilitySet keys shared by all sibling references
+        capset_keys = capability_ref.key[:2]
+
+        # Filter out malformed relations before building any elements;
+        # idx keeps the position in the original list for the id_short
+        valid_relations = [
+            (relation.get('type', 'requires'), relation['target'], idx)
+            for idx, relation in enumerate(relations)
+            if isinstance(relation, dict) and relation.get('target')
+        ]
 
+        relation_elements = []
+        for relation_type, target_capability, idx in valid_relations:
             # Create a relationship element for each relation
-            rel_element = self.element_factory.create_relationship(
+            rel_element = create_relationship(
                 id_short=f"{relation_type}_{idx}",
-                first=model.ModelReference(
-                    (model.Key(
-                        type_=model.KeyTypes.SUBMODEL,
-                        value=f"{self.base_url}/submodels/instances/{system_id}/OfferedCapabilityDescription"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                        value="CapabilitySet"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                        value=cap_config.get(
-                            'id_short', cap_name + 'Container')
-                    )),
-                    model.SubmodelElementCollection
-                ),
-                second=model.ModelReference(
-                    (model.Key(
-                        type_=model.KeyTypes.SUBMODEL,
-                        value=f"{self.base_url}/submodels/instances/{system_id}/OfferedCapabilityDescription"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                        value="CapabilitySet"
-                    ),
-                        model.Key(
-                        type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
+                first=capability_ref,
+                second=ModelReference(
+                    capset_keys + (Key(
+                        type_=_SMC,
                         value=target_capability
-                    )),
-                    model.SubmodelElementCollection
+                    ),),
+                    SMC_CLS
                 )
             )
             relation_elements.append(rel_element)
 
         return relation_elements
-
-    def _create_property_set(self, cap_config: Dict) -> Optional[model.SubmodelElementCollection]:
-        """
-        Create the PropertySet collection.
-
-        Args:
-            cap_config: Configuration for the capability
-
-        Returns:
-            SubmodelElementCollection for PropertySet, or None if no properties
-        """
-        if 'properties' not in cap_config or not cap_config['properties']:
-            return None
-
-        property_elements = []
-        for prop in cap_config['properties']:
-            prop_container = self._create_property_container(prop)
-            if prop_container:
-                property_elements.append(prop_container)
-
-        if not property_elements:
-            return None
-
-        return self.element_factory.create_collection(
-            id_short="PropertySet",
-            elements=property_elements
-        )
-
-    def _create_property_container(self, prop: Dict) -> Optional[model.SubmodelElementCollection]:
-        """
-        Create a property container for a capability property.
-
-        Args:
-            prop: Property configuration dictionary
-
-        Returns:
-            SubmodelElementCollection for the property, or None if invalid
-        """
-        prop_container_elements = []
-
-        # Add Comment if description is present and not empty
-        if 'description' in prop and prop['description']:
-            prop_container_elements.append(
-                self.element_factory.create_multi_language_property(
-                    id_short="Comment",
-                    text=prop['description']
-                )
-            )
-
-        # Add Property value or range
-        if 'min' in prop and 'max' in prop:
-            prop_container_elements.append(
-                self.element_factory.create_range(
-                    id_short=prop['name'],
-                    min_value=float(prop['min']),
-                    max_value=float(prop['max']),
-                    value_type=model.datatypes.Double
-                )
-            )
-        elif 'value' in prop:
-            prop_container_elements.append(
-                self.element_factory.create_property(
-                    id_short=prop['name'],
-                    value=prop['value'],
-                    value_type=model.datatypes.String
-                )
-            )
-
-        if not prop_container_elements:
-            return None
-
-        return self.element_factory.create_collection(
-            id_short=f"PropertyContainer_{prop['name']}",
-            elements=prop_container_elements
-        )
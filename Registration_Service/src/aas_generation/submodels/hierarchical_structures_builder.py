@@ -1,8 +1,23 @@
 """Hierarchical Structures Submodel Builder for AAS generation."""
 
+from types import MappingProxyType
 from typing import Dict, List
 from basyx.aas import model
 
+# Key types, entity types and id_shorts used in hierarchy elements
+_SM = model.KeyTypes.SUBMODEL
+_ENT = model.KeyTypes.ENTITY
+_ENTRY = "EntryNode"
+_SELF = model.EntityType.SELF_MANAGED_ENTITY
+_CO = model.EntityType.CO_MANAGED_ENTITY
+# Keys are immutable, so the EntryNode key is shared by all references
+_ENTRY_NODE_KEY = model.Key(_ENT, _ENTRY)
+
+# Shared read-only defaults for missing or empty config sections and
+# for Node entities without statements
+_EMPTY_DICT = MappingProxyType({})
+_NO_STATEMENTS = ()
+
 
 class HierarchicalStructuresSubmodelBuilder:
     """
@@ -24,6 +39,12 @@ class HierarchicalStructuresSubmodelBuilder:
         self.base_url = base_url
         self.semantic_factory = semantic_factory
         self.element_factory = element_factory
+        
+        # Semantic IDs used once per child entity, resolved once
+        self._sid_entry_node = semantic_factory.ENTRY_NODE
+        self._sid_node = semantic_factory.HIERARCHICAL_NODE
+        self._sid_same_as = semantic_factory.HIERARCHICAL_SAME_AS
+        self._sid_relationship = semantic_factory.HIERARCHICAL_RELATIONSHIP
     
     def build(self, system_id: str, config: Dict) -> model.Submodel:
         """
@@ -38,7 +59,6 @@ class HierarchicalStructuresSubmodelBuilder:
                         systemId: 'optional-config-key'  # defaults to systemName + 'AAS'
         
         Auto-derives:
-            - aasId from systemName
             - submodelId from systemId (defaults to systemName + 'AAS')
         
         Args:
@@ -48,7 +68,7 @@ class HierarchicalStructuresSubmodelBuilder:
         Returns:
             HierarchicalStructures submodel instance
         """
-        hs_config = config.get('HierarchicalStructures', {}) or {}
+        hs_config = config.get('HierarchicalStructures') or _EMPTY_DICT
         archetype = hs_config.get('Archetype', 'OneUp')
         global_asset_id = config.get('globalAssetId', f"{self.base_url}/assets/{system_id}")
         
@@ -56,8 +76,8 @@ class HierarchicalStructuresSubmodelBuilder:
         archetype_property = self._create_archetype_property(archetype)
         
         # Create EntryNode with relationships
-        aas_id = config.get('id', f"{self.base_url}/aas/{system_id}")
-        entry_node = self._create_entry_node(system_id, global_asset_id, hs_config, archetype, aas_id)
+        submodel_id = f"{self.base_url}/submodels/instances/{system_id}/HierarchicalStructures"
+        entry_node = self._create_entry_node(submodel_id, global_asset_id, hs_config, archetype)
         
         # Create display name as LangStringSet
         display_name_value = hs_config.get('Name', 'HierarchicalStructures')
@@ -67,7 +87,7 @@ class HierarchicalStructuresSubmodelBuilder:
             display_name = display_name_value
         
         submodel = model.Submodel(
-            id_=f"{self.base_url}/submodels/instances/{system_id}/HierarchicalStructures",
+            id_=submodel_id,
             id_short="HierarchicalStructures",
             display_name=display_name,
             kind=model.ModellingKind.INSTANCE,
@@ -87,32 +107,45 @@ class HierarchicalStructuresSubmodelBuilder:
             semantic_id=self.semantic_factory.HIERARCHICAL_ARCHETYPE
         )
     
-    def _create_entry_node(self, system_id: str, global_asset_id: str,
-                          hs_config: Dict, archetype: str, aas_id: str) -> model.Entity:
+    def _create_entry_node(self, submodel_id: str, global_asset_id: str,
+                          hs_config: Dict, archetype: str) -> model.Entity:
         """Create the EntryNode entity with Node children and relationships."""
         node_entities = []
-        entry_node_statements = []
-        
-        # Handle both IsPartOf and HasPart (now as dicts)
-        is_part_of = hs_config.get('IsPartOf', {})
-        has_part = hs_config.get('HasPart', {})
-        
-        # Determine which statements to process based on archetype
-        statements_to_process = {}
-        relationship_prefix = ""
+        relationships = []
         
+        # Determine which statements to process based on archetype;
+        # the config section (as dict) is named like the relationship prefix
         if archetype == 'OneUp':
-            statements_to_process = is_part_of if isinstance(is_part_of, dict) else {}
             relationship_prefix = "IsPartOf"
         elif archetype == 'OneDown':
-            statements_to_process = has_part if isinstance(has_part, dict) else {}
             relationship_prefix = "HasPart"
+        else:
+            relationship_prefix = ""
+        
+        statements = hs_config.get(relationship_prefix) if relationship_prefix else None
+        statements_to_process = statements if isinstance(statements, dict) else _EMPTY_DICT
+        
+        # Reference to the EntryNode, shared as first of all relationships
+        # AASd-125 compliant: First key is AasIdentifiable (SUBMODEL),
+        # subsequent keys are FragmentKeys (ENTITY)
+        entry_node_ref = model.ModelReference(
+            (
+                model.Key(_SM, submodel_id),
+                _ENTRY_NODE_KEY
+            ),
+            model.Entity
+        )
+        
+        create_node_entity = self._create_node_entity
+        create_relationship = self._create_relationship
+        add_node_entity = node_entities.append
+        add_relationship = relationships.append
         
         # Process each entity in the hierarchy (dict format)
         for entity_name, entity_config in statements_to_process.items():
-            # entity_config should be a dict with globalAssetId, systemId, aasId, etc.
+            # entity_config should be a dict with globalAssetId, systemId, submodelId, etc.
             if not isinstance(entity_config, dict):
-                entity_config = {}
+                entity_config = _EMPTY_DICT
             
             # Auto-derive missing IDs
             # Convention: systemId should include 'AAS' suffix for submodel path consistency
@@ -123,52 +156,47 @@ class HierarchicalStructuresSubmodelBuilder:
             else:
                 entity_system_id_for_submodel = entity_system_id
                 
-            entity_aas_id = entity_config.get(
-                'aasId',
-                f"{self.base_url}/aas/{entity_system_id}"
-            )
             entity_submodel_id = entity_config.get(
                 'submodelId',
                 f"{self.base_url}/submodels/instances/{entity_system_id_for_submodel}/HierarchicalStructures"
             )
             entity_global_asset_id = entity_config.get('globalAssetId', '')
             
-            # Create Node entity with SameAs reference (includes target AAS ID for jump button)
-            node_entity = self._create_node_entity(
-                entity_name, entity_global_asset_id, entity_submodel_id, entity_aas_id
+            # Create Node entity with SameAs reference to the target hierarchy
+            node_entity = create_node_entity(
+                entity_name, entity_global_asset_id, entity_submodel_id
             )
-            node_entities.append(node_entity)
+            add_node_entity(node_entity)
             
             # Create relationship element (uses current submodel, not target)
-            relationship = self._create_relationship(
-                system_id, entity_name, relationship_prefix, aas_id
+            relationship = create_relationship(
+                entry_node_ref, entity_name, relationship_prefix
             )
-            entry_node_statements.append(relationship)
+            add_relationship(relationship)
         
-        # Add all Node entities to EntryNode statements
-        entry_node_statements.extend(node_entities)
+        # EntryNode statements: all relationships followed by all Node entities
+        entry_node_statements = relationships + node_entities
         
         entry_node = model.Entity(
-            id_short="EntryNode",
-            entity_type=model.EntityType.SELF_MANAGED_ENTITY,
+            id_short=_ENTRY,
+            entity_type=_SELF,
             global_asset_id=global_asset_id,
-            semantic_id=self.semantic_factory.ENTRY_NODE,
-            statement=entry_node_statements if entry_node_statements else []
+            semantic_id=self._sid_entry_node,
+            statement=entry_node_statements
         )
         
         return entry_node
     
     def _create_node_entity(self, entity_name: str, global_asset_id: str,
-                           submodel_id: str, aas_id: str = None) -> model.Entity:
+                           submodel_id: str) -> model.Entity:
         """Create a Node entity with optional SameAs reference.
         
         Args:
             entity_name: Name/idShort for the entity
             global_asset_id: Global asset ID for the entity
             submodel_id: Target HierarchicalStructures submodel ID
-            aas_id: Unused, kept for API compatibility
         """
-        node_statements = []
+        node_statements = _NO_STATEMENTS
         
         # Create SameAs reference if submodel ID is provided
         # AASd-125 compliant: First key is AasIdentifiable (SUBMODEL),
@@ -176,62 +204,54 @@ class HierarchicalStructuresSubmodelBuilder:
         if submodel_id:
             same_as_reference = model.ModelReference(
                 (
-                    model.Key(model.KeyTypes.SUBMODEL, submodel_id),
-                    model.Key(model.KeyTypes.ENTITY, "EntryNode")
+                    model.Key(_SM, submodel_id),
+                    _ENTRY_NODE_KEY
                 ),
                 model.Entity
             )
             same_as = self.element_factory.create_reference_element(
                 id_short="SameAs",
                 reference=same_as_reference,
-                semantic_id=self.semantic_factory.HIERARCHICAL_SAME_AS,
+                semantic_id=self._sid_same_as,
                 supplemental_semantic_ids=[
-                    self.semantic_factory.ENTRY_NODE
+                    self._sid_entry_node
                 ]
             )
-            node_statements.append(same_as)
+            node_statements = (same_as,)
         
         # SELF_MANAGED requires globalAssetId, CO_MANAGED doesn't
-        is_self_managed = bool(global_asset_id)
+        if global_asset_id:
+            entity_type = _SELF
+        else:
+            entity_type = _CO
+            global_asset_id = None
         
         return self.element_factory.create_entity(
             id_short=entity_name,
-            entity_type=model.EntityType.SELF_MANAGED_ENTITY if is_self_managed else model.EntityType.CO_MANAGED_ENTITY,
-            global_asset_id=global_asset_id if global_asset_id else None,
-            statements=node_statements if node_statements else None,
-            semantic_id=self.semantic_factory.HIERARCHICAL_NODE
+            entity_type=entity_type,
+            global_asset_id=global_asset_id,
+            statements=node_statements,
+            semantic_id=self._sid_node
         )
     
-    def _create_relationship(self, system_id: str, entity_name: str,
-                            relationship_prefix: str, aas_id: str = None) -> model.RelationshipElement:
+    def _create_relationship(self, entry_node_ref: model.ModelReference, entity_name: str,
+                            relationship_prefix: str) -> model.RelationshipElement:
         """Create a relationship element between EntryNode and a child Node.
         
         Args:
-            system_id: System ID for deriving submodel path
+            entry_node_ref: Reference to the EntryNode of this submodel
             entity_name: Name of the child entity
             relationship_prefix: 'IsPartOf' or 'HasPart'
-            aas_id: Unused, kept for API compatibility
         """
         # AASd-125 compliant: First key is AasIdentifiable (SUBMODEL),
         # subsequent keys are FragmentKeys (ENTITY)
-        submodel_id = f"{self.base_url}/submodels/instances/{system_id}/HierarchicalStructures"
-        
         return self.element_factory.create_relationship(
             id_short=f"{relationship_prefix}_{entity_name}",
-            first=model.ModelReference(
-                (
-                    model.Key(model.KeyTypes.SUBMODEL, submodel_id),
-                    model.Key(model.KeyTypes.ENTITY, "EntryNode")
-                ),
-                model.Entity
-            ),
+            first=entry_node_ref,
+            # Keys are immutable, so the child path extends the EntryNode keys
             second=model.ModelReference(
-                (
-                    model.Key(model.KeyTypes.SUBMODEL, submodel_id),
-                    model.Key(model.KeyTypes.ENTITY, "EntryNode"),
-                    model.Key(model.KeyTypes.ENTITY, entity_name)
-                ),
+                entry_node_ref.key + (model.Key(_ENT, entity_name),),
                 model.Entity
             ),
-            semantic_id=self.semantic_factory.HIERARCHICAL_RELATIONSHIP
+            semantic_id=self._sid_relationship
         )
@@ -1,10 +1,29 @@
 """Parameters Submodel Builder for AAS generation."""
 
+from operator import itemgetter
 from typing import Dict, List, Optional
 from basyx.aas import model
 
 from ..schema_handler import SchemaHandler
 
+# Key types used in interface references
+_SM = model.KeyTypes.SUBMODEL
+_SMC = model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION
+
+# Config keys of a parameter that are not parameter fields
+_RESERVED_KEYS = frozenset(('semanticId', 'InterfaceReference', 'Field'))
+
+# Name of an interface property dict
+_property_name = itemgetter('name')
+
+# AAS value types of config values, by exact Python type; bool is keyed
+# separately from int, other values are stored as strings
+_PY_TO_AAS = {
+    bool: model.datatypes.Boolean,
+    int: model.datatypes.Int,
+    float: model.datatypes.Double,
+}
+
 
 class ParametersSubmodelBuilder:
     """
@@ -32,8 +51,11 @@ class ParametersSubmodelBuilder:
         self.semantic_factory = semantic_factory
         self.element_factory = element_factory
         self.schema_handler = schema_handler or SchemaHandler()
-        self.current_system_id = None
-        self._properties_cache = None
+        self._interface_keys = ()
+        # Property lookup by name, rebuilt on every build
+        self._properties_cache = {}
+        # Semantic ID of every InterfaceReference, resolved once
+        self._sid_interface_reference = semantic_factory.INTERFACE_REFERENCE
 
     def build(self, system_id: str, config: Dict, properties: List[Dict] = None) -> model.Submodel:
         """
@@ -47,14 +69,33 @@ class ParametersSubmodelBuilder:
         Returns:
             Parameters submodel instance
         """
-        self.current_system_id = system_id
+        # Keys up to the AID properties collection, shared by all
+        # interface references of this system
+        self._interface_keys = (
+            model.Key(
+                type_=_SM,
+                value=f"{self.base_url}/submodels/instances/{system_id}/AssetInterfacesDescription"
+            ),
+            model.Key(
+                type_=_SMC,
+                value="InterfaceMQTT"
+            ),
+            model.Key(
+                type_=_SMC,
+                value="InteractionMetadata"
+            ),
+            model.Key(
+                type_=_SMC,
+                value="properties"
+            )
+        )
         parameters_config = config.get('Parameters', {}) or {}
         parameter_elements = []
 
         # Build property lookup for schema-driven field extraction
-        self._properties_cache = {}
-        if properties:
-            self._properties_cache = {p['name']: p for p in properties}
+        self._properties_cache = (
+            dict(zip(map(_property_name, properties), properties))
+            if properties else {})
 
         # Handle dict format: Parameters: { ParamName: {...}, ... }
         for param_name, param_config in parameters_config.items():
@@ -101,14 +142,20 @@ class ParametersSubmodelBuilder:
         # Optional: extract only this field
         specific_field = param_config.get('Field')
 
+        # Without an interface reference only non-reserved config keys
+        # become elements, so a config of reserved keys yields nothing
+        if not interface_ref and _RESERVED_KEYS.issuperset(param_config):
+            return None
+
         # Try to get fields from schema if interface reference exists
         # Parameters use 'input' schema (for setting values)
         schema_fields = {}
         if interface_ref and self._properties_cache:
             prop = self._properties_cache.get(interface_ref)
-            if prop and prop.get('schema'):
+            schema_url = prop.get('schema') if prop else None
+            if schema_url:
                 all_schema_fields = self.schema_handler.extract_data_fields(
-                    prop['schema'])
+                    schema_url)
 
                 # If a specific field is requested, filter to just that field
                 if specific_field and specific_field in all_schema_fields:
@@ -119,19 +166,18 @@ class ParametersSubmodelBuilder:
 
         # Use schema-derived fields if available, otherwise fall back to config
         if schema_fields and self.element_factory:
+            # Field values given in the config override the schema defaults
+            overrides = {key: value for key, value in param_config.items()
+                         if key not in _RESERVED_KEYS}
+            create_property = self.element_factory.create_property
             for field_name, field_def in schema_fields.items():
                 # Get default value from config if provided, otherwise use schema default
-                config_value = None
-                for key, value in param_config.items():
-                    if key not in ['semanticId', 'InterfaceReference', 'Field'] and key == field_name:
-                        config_value = value
-                        break
-
+                config_value = overrides.get(field_name)
                 value = config_value if config_value is not None else field_def['default_value']
                 value_type = field_def['aas_type']
 
                 elements.append(
-                    self.element_factory.create_property(
+                    create_property(
                         id_short=field_name,
                         value_type=value_type,
                         value=value
@@ -139,23 +185,20 @@ class ParametersSubmodelBuilder:
                 )
         elif self.element_factory:
             # Fallback: use fields defined directly in config
+            value_type_of = _PY_TO_AAS.get
+            create_property = self.element_factory.create_property
             for key, value in param_config.items():
-                if key in ['semanticId', 'InterfaceReference', 'Field']:
+                if key in _RESERVED_KEYS:
                     continue
 
                 # Determine value type
-                if isinstance(value, bool):
-                    value_type = model.datatypes.Boolean
-                elif isinstance(value, int):
-                    value_type = model.datatypes.Int
-                elif isinstance(value, float):
-                    value_type = model.datatypes.Double
-                else:
+                value_type = value_type_of(type(value))
+                if value_type is None:
                     value_type = model.datatypes.String
                     value = str(value)
 
                 elements.append(
-                    self.element_factory.create_property(
+                    create_property(
                         id_short=key,
                         value_type=value_type,
                         value=value
@@ -199,27 +242,11 @@ class ParametersSubmodelBuilder:
         return self.element_factory.create_reference_element(
             id_short="InterfaceReference",
             reference=model.ModelReference(
-                (model.Key(
-                    type_=model.KeyTypes.SUBMODEL,
-                    value=f"{self.base_url}/submodels/instances/{self.current_system_id}/AssetInterfacesDescription"
-                ),
-                    model.Key(
-                    type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                    value="InterfaceMQTT"
-                ),
-                    model.Key(
-                    type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                    value="InteractionMetadata"
-                ),
-                    model.Key(
-                    type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
-                    value="properties"
-                ),
-                    model.Key(
-                    type_=model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
+                self._interface_keys + (model.Key(
+                    type_=_SMC,
                     value=interface_ref_name
-                )),
+                ),),
                 model.SubmodelElementCollection
             ),
-            semantic_id=self.semantic_factory.INTERFACE_REFERENCE
+            semantic_id=self._sid_interface_reference
         )
@@ -6,9 +6,50 @@ This module provides builders for Process AAS specific submodels:
 - Policy: Behavior tree policy reference
 """
 
-from typing import Dict, List, Any, Optional
+import functools
+import logging
+from typing import Dict, Any, Iterator, Optional, Sequence, Tuple
 from basyx.aas import model
 
+logger = logging.getLogger(__name__)
+
+_String = model.datatypes.String
+
+# Classes instantiated once per resource reference
+_Key = model.Key
+_ModelReference = model.ModelReference
+_ReferenceElement = model.ReferenceElement
+_Capability = model.Capability
+
+# Key types of capability reference chains
+_SM = model.KeyTypes.SUBMODEL
+_SMC = model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION
+_CAP = model.KeyTypes.CAPABILITY
+
+
+@functools.lru_cache(maxsize=1024)
+def _capability_target(instances_prefix: str, id_short: str,
+                       capability_name: str) -> Tuple[str, Tuple[str, str, str]]:
+    """
+    Derive the location of a capability in an asset's capability submodel.
+    
+    Resources of a capability are usually shared by many processes, so the
+    submodel ID and the immutable path tuple are cached and reused.
+    
+    Args:
+        instances_prefix: Submodel instances URL prefix, ending with '/'
+        id_short: idShort of the asset AAS
+        capability_name: Name of the capability
+        
+    Returns:
+        Tuple of the OfferedCapabilityDescription submodel ID and the
+        idShort path to the capability
+    """
+    return (
+        instances_prefix + id_short + "/OfferedCapabilityDescription",
+        ("CapabilitySet", f"{capability_name}Container", capability_name)
+    )
+
 
 class ProcessInformationSubmodelBuilder:
     """Builder for ProcessInformation submodel.
@@ -18,6 +59,9 @@ class ProcessInformationSubmodelBuilder:
     
     SEMANTIC_ID = "https://smartproductionlab.aau.dk/submodels/ProcessInformation/1/0"
     
+    # Simple string properties (excluding ProductReference - handled separately)
+    _STRING_PROPS = ('ProcessName', 'ProcessType', 'CreatedAt', 'Status')
+    
     def __init__(self, base_url: str, semantic_factory, element_factory):
         self.base_url = base_url
         self.semantic_factory = semantic_factory
@@ -34,22 +78,22 @@ class ProcessInformationSubmodelBuilder:
                 Status: "planned"
                 ProductReference: "https://smartproductionlab.aau.dk/aas/HgHAAS"
         """
-        process_info = config.get('ProcessInformation', {})
+        process_info = config.get('ProcessInformation')
         if not process_info:
             return None
         
-        elements = []
-        
-        # Simple string properties (excluding ProductReference - handled separately)
-        string_props = ['ProcessName', 'ProcessType', 'CreatedAt', 'Status']
-        for prop_name in string_props:
-            value = process_info.get(prop_name)
-            if value:
-                elements.append(model.Property(
-                    id_short=prop_name,
-                    value_type=model.datatypes.String,
-                    value=str(value)
-                ))
+        # Simple string properties, skipping missing or empty values
+        Property = model.Property
+        string_props = self._STRING_PROPS
+        elements = [
+            Property(
+                id_short=prop_name,
+                value_type=_String,
+                value=str(value)
+            )
+            for prop_name, value in zip(string_props, map(process_info.get, string_props))
+            if value
+        ]
         
         # ProductReference as ReferenceElement pointing to the Product AAS
         product_ref = process_info.get('ProductReference')
@@ -70,9 +114,7 @@ class ProcessInformationSubmodelBuilder:
             id_=f"{self.base_url}/submodels/instances/{system_id}/ProcessInformation",
             id_short="ProcessInformation",
             kind=model.ModellingKind.INSTANCE,
-            semantic_id=model.ExternalReference(
-                key=(model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=self.SEMANTIC_ID),)
-            ),
+            semantic_id=self.semantic_factory.create_external_reference(self.SEMANTIC_ID),
             administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=elements
         )
@@ -113,6 +155,8 @@ class RequiredCapabilitiesSubmodelBuilder:
             element_factory: Factory for AAS elements
         """
         self.base_url = base_url
+        # Part of the _capability_target cache key for capability references
+        self._instances_prefix = f"{base_url}/submodels/instances/"
         self.semantic_factory = semantic_factory
         self.element_factory = element_factory
     
@@ -133,7 +177,7 @@ class RequiredCapabilitiesSubmodelBuilder:
                         planarShuttle1: "https://smartproductionlab.aau.dk/aas/planarShuttle1AAS"
                         planarShuttle2: "https://smartproductionlab.aau.dk/aas/planarShuttle2AAS"
         """
-        capabilities = config.get('RequiredCapabilities', {})
+        capabilities = config.get('RequiredCapabilities')
         if not capabilities:
             return None
         
@@ -148,60 +192,61 @@ class RequiredCapabilitiesSubmodelBuilder:
             id_=f"{self.base_url}/submodels/instances/{system_id}/RequiredCapabilities",
             id_short="RequiredCapabilities",
             kind=model.ModellingKind.INSTANCE,
-            semantic_id=model.ExternalReference(
-                key=(model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=self.SEMANTIC_ID),)
-            ),
+            semantic_id=self.semantic_factory.create_external_reference(self.SEMANTIC_ID),
             administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=cap_collections
         )
     
     def _build_capability_type(self, cap_name: str, cap_config: Dict) -> model.SubmodelElementCollection:
         """Build a capability type collection with description and references collection."""
-        elements = []
-        
         # Description property
         description = cap_config.get('description', '')
+        description_element = None
         if description:
-            elements.append(model.Property(
+            description_element = model.Property(
                 id_short="Description",
-                value_type=model.datatypes.String,
+                value_type=_String,
                 value=description
-            ))
+            )
         
         # Check for new format (resources with AAS ID) or legacy format (references)
-        resources = cap_config.get('resources', {})
-        references = cap_config.get('references', {})
-        
-        ref_elements = []
+        resources = cap_config.get('resources')
+        references = cap_config.get('references')
         
         if resources:
             # New simplified format: derive capability reference from AAS ID
-            for resource_name, aas_id in resources.items():
-                ref_element = self._build_capability_reference_from_aas_id(
-                    resource_name, aas_id, cap_name
-                )
-                if ref_element:
-                    ref_elements.append(ref_element)
+            ref_elements = list(
+                self._iter_capability_references_from_aas_ids(resources, cap_name)
+            )
         elif references:
             # Legacy explicit format
-            for resource_name, ref_config in references.items():
-                ref_element = self._build_capability_reference(resource_name, ref_config)
-                if ref_element:
-                    ref_elements.append(ref_element)
+            build_ref = self._build_capability_reference
+            ref_elements = [
+                ref_element
+                for resource_name, ref_config in references.items()
+                if (ref_element := build_ref(resource_name, ref_config)) is not None
+            ]
+        else:
+            ref_elements = None
         
+        references_element = None
         if ref_elements:
-            elements.append(model.SubmodelElementCollection(
+            references_element = model.SubmodelElementCollection(
                 id_short="References",
                 value=ref_elements
-            ))
+            )
+        
+        # Collection elements in order, skipping the absent ones
+        elements = [
+            element for element in (description_element, references_element)
+            if element is not None
+        ]
         
         # Semantic ID from capability type (decorates the collection)
         semantic_id = cap_config.get('semantic_id', '')
         semantic_ref = None
         if semantic_id:
-            semantic_ref = model.ExternalReference(
-                key=(model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=semantic_id),)
-            )
+            semantic_ref = self.semantic_factory.create_external_reference(semantic_id)
         
         return model.SubmodelElementCollection(
             id_short=cap_name,
@@ -209,15 +254,15 @@ class RequiredCapabilitiesSubmodelBuilder:
             semantic_id=semantic_ref
         )
     
-    def _build_capability_reference_from_aas_id(
+    def _iter_capability_references_from_aas_ids(
         self, 
-        resource_name: str, 
-        aas_id: str, 
+        resources: Dict[str, str], 
         capability_name: str
-    ) -> Optional[model.ReferenceElement]:
-        """Build ReferenceElement by deriving capability reference from AAS ID.
+    ) -> Iterator[model.ReferenceElement]:
+        """Yield ReferenceElements by deriving capability references from AAS IDs.
         
-        Extracts idShort from AAS ID and constructs standardized capability path.
+        Extracts idShort from each AAS ID and constructs standardized capability path.
+        Resources whose AAS ID cannot be parsed are logged and skipped.
         
         Example:
             AAS ID: https://smartproductionlab.aau.dk/aas/imaLoadingSystemAAS
@@ -226,29 +271,34 @@ class RequiredCapabilitiesSubmodelBuilder:
             → capability_path: ["CapabilitySet", "LoadingContainer", "Loading"]
         
         Args:
-            resource_name: Name of the resource (used as id_short)
-            aas_id: The AAS ID URL (e.g., https://smartproductionlab.aau.dk/aas/imaLoadingSystemAAS)
+            resources: Resource names (used as id_short) mapped to AAS ID URLs
+                       (e.g., https://smartproductionlab.aau.dk/aas/imaLoadingSystemAAS)
             capability_name: Name of the capability (e.g., "Loading", "MoveToPosition")
             
-        Returns:
-            ReferenceElement pointing to the capability, or None if parsing fails
+        Yields:
+            ReferenceElement pointing to the capability, per parsable resource
         """
-        # Extract idShort from AAS ID (last segment after /aas/)
-        id_short = self._extract_id_short_from_aas_id(aas_id)
-        if not id_short:
-            import logging
-            logging.getLogger(__name__).warning(
-                f"Could not extract idShort from AAS ID: {aas_id}"
+        extract_id_short = self._extract_id_short_from_aas_id
+        build_reference_element = self._build_reference_element
+        instances_prefix = self._instances_prefix
+        
+        for resource_name, aas_id in resources.items():
+            # Extract idShort from AAS ID (last segment after /aas/)
+            id_short = extract_id_short(aas_id)
+            if not id_short:
+                logger.warning("Could not extract idShort from AAS ID: %s", aas_id)
+                continue
+            
+            # Construct submodel ID and capability path
+            submodel_id, capability_path = _capability_target(
+                instances_prefix, id_short, capability_name
             )
-            return None
-        
-        # Construct submodel ID and capability path
-        submodel_id = f"{self.base_url}/submodels/instances/{id_short}/OfferedCapabilityDescription"
-        capability_path = ["CapabilitySet", f"{capability_name}Container", capability_name]
-        
-        return self._build_reference_element(resource_name, submodel_id, capability_path)
+            
+            yield build_reference_element(resource_name, submodel_id, capability_path)
     
-    def _extract_id_short_from_aas_id(self, aas_id: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_id_short_from_aas_id(aas_id: str) -> Optional[str]:
         """Extract idShort from AAS ID URL.
         
         The AAS ID URL typically contains the system name (e.g., imaLoadingSystem),
@@ -264,12 +314,13 @@ class RequiredCapabilitiesSubmodelBuilder:
         if not aas_id:
             return None
         
-        # Try to extract from /aas/ pattern
-        if '/aas/' in aas_id:
-            extracted = aas_id.split('/aas/')[-1].rstrip('/')
+        # Try to extract from /aas/ pattern (segment after the last one)
+        _, sep, extracted = aas_id.rpartition('/aas/')
+        if sep:
+            extracted = extracted.rstrip('/')
         else:
             # Fallback: use last path segment
-            extracted = aas_id.rstrip('/').split('/')[-1]
+            extracted = aas_id.rstrip('/').rpartition('/')[2]
         
         # Ensure AAS suffix is present (convention: idShort = systemName + "AAS")
         if extracted and not extracted.endswith('AAS'):
@@ -288,7 +339,7 @@ class RequiredCapabilitiesSubmodelBuilder:
                                    e.g., ["CapabilitySet", "DispensingContainer", "Dispensing"]
         """
         submodel_id = cap_ref_config.get('submodel_id')
-        capability_path = cap_ref_config.get('capability_path', [])
+        capability_path = cap_ref_config.get('capability_path', ())
         
         if not submodel_id:
             return None
@@ -299,7 +350,7 @@ class RequiredCapabilitiesSubmodelBuilder:
         self, 
         resource_name: str, 
         submodel_id: str, 
-        capability_path: List[str]
+        capability_path: Sequence[str]
     ) -> model.ReferenceElement:
         """Build ReferenceElement with key chain to capability.
         
@@ -311,32 +362,31 @@ class RequiredCapabilitiesSubmodelBuilder:
         Returns:
             ReferenceElement pointing to the capability
         """
-        # Build the key chain
-        keys = [
-            model.Key(
-                type_=model.KeyTypes.SUBMODEL,
-                value=submodel_id
+        # Build the key chain:
+        # last path element is the Capability, others are SubmodelElementCollections
+        if len(capability_path) == 3:
+            # Usual CapabilitySet/Container/Capability path
+            capability_set, container, capability = capability_path
+            keys = (
+                _Key(type_=_SM, value=submodel_id),
+                _Key(type_=_SMC, value=capability_set),
+                _Key(type_=_SMC, value=container),
+                _Key(type_=_CAP, value=capability),
             )
-        ]
-        
-        # Add keys for the path to the capability element
-        for i, path_element in enumerate(capability_path):
-            # Last element is the Capability, others are SubmodelElementCollections
-            if i == len(capability_path) - 1:
-                key_type = model.KeyTypes.CAPABILITY
-            else:
-                key_type = model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION
-            
-            keys.append(model.Key(
-                type_=key_type,
-                value=path_element
-            ))
+        else:
+            keys = (_Key(type_=_SM, value=submodel_id),)
+            if capability_path:
+                keys += tuple(
+                    _Key(type_=_SMC, value=path_element)
+                    for path_element in capability_path[:-1]
+                )
+                keys += (_Key(type_=_CAP, value=capability_path[-1]),)
         
-        return model.ReferenceElement(
+        return _ReferenceElement(
             id_short=resource_name,
-            value=model.ModelReference(
-                key=tuple(keys),
-                type_=model.Capability
+            value=_ModelReference(
+                key=keys,
+                type_=_Capability
             )
         )
 
@@ -362,14 +412,14 @@ class PolicySubmodelBuilder:
                     contentType: "application/xml"
                     description: "Production behavior tree policy"
         """
-        policy = config.get('Policy', {})
+        policy = config.get('Policy')
         if not policy:
             return None
         
         elements = []
         
         # Behavior Tree reference
-        policy_config = policy.get('Policy', {})
+        policy_config = policy.get('Policy')
         if policy_config:
             policy_file = policy_config.get('File', '')
             content_type = policy_config.get('contentType', 'application/xml')
@@ -391,9 +441,7 @@ class PolicySubmodelBuilder:
             id_=f"{self.base_url}/submodels/instances/{system_id}/Policy",
             id_short="Policy",
             kind=model.ModellingKind.INSTANCE,
-            semantic_id=model.ExternalReference(
-                key=(model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=policy_semantic),)
-            ),
+            semantic_id=self.semantic_factory.create_external_reference(policy_semantic),
             administration=model.AdministrativeInformation(version="1", revision="0"),
             submodel_element=elements
         )
@@ -44,7 +44,7 @@ class ConfigParser:
                 "Either config_data or config_path must be provided")
 
         # Config contains a single system with the system ID as the top-level key
-        self.system_id = list(config_data.keys())[0]
+        self.system_id = next(iter(config_data))
         self.config = config_data[self.system_id]
 
         # Initialize schema handler for schema-driven field extraction
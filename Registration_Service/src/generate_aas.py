@@ -49,7 +49,7 @@ class AASGenerator:
             self.config = yaml.safe_load(f)
 
         # Extract system info from config
-        self.system_id = list(self.config.keys())[0]
+        self.system_id = next(iter(self.config))
         self.system_config = self.config[self.system_id]
 
         # Set base URL from system configuration
@@ -0,0 +1,32 @@
+"""Shared setup for the AAS generation tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the service root to path so that src is importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.aas_generation.element_factory import AASElementFactory
+from src.aas_generation.semantic_ids import SemanticIdFactory
+
+BASE_URL = "https://example.com"
+
+
+@pytest.fixture
+def base_url():
+    return BASE_URL
+
+
+@pytest.fixture
+def element_factory():
+    return AASElementFactory()
+
+
+@pytest.fixture
+def make_builder(element_factory):
+    """Return a function creating a submodel builder for BASE_URL."""
+    def make(builder_cls, **kwargs):
+        return builder_cls(BASE_URL, SemanticIdFactory(), element_factory, **kwargs)
+    return make
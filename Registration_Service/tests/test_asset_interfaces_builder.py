@@ -0,0 +1,56 @@
+"""Tests for the AssetInterfacesDescription submodel builder."""
+
+import pytest
+
+from src.aas_generation.submodels.asset_interfaces_builder import AssetInterfacesBuilder
+
+
+def _interaction(actions=None, properties=None):
+    return {
+        'AssetInterfacesDescription': {
+            'InterfaceMQTT': {
+                'InteractionMetadata': {
+                    'actions': actions or {},
+                    'properties': properties or {},
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def build(make_builder):
+    builder = make_builder(AssetInterfacesBuilder)
+
+    def build(config):
+        submodel = builder.build("testAAS", config)
+        interface = submodel.get_referable("InterfaceMQTT")
+        return interface.get_referable("InteractionMetadata")
+    return build
+
+
+def test_action_fields_follow_table_order_and_skip_missing_keys(build):
+    interaction = build(_interaction(actions={
+        'start': {
+            'forms': {'href': '/start'},
+            'synchronous': 'True',
+            'title': 'Start',
+        },
+    }))
+
+    action = interaction.get_referable("actions").get_referable("start")
+    assert [element.id_short for element in action.value] == ["Title", "Synchronous", "Forms"]
+    assert action.get_referable("Synchronous").value is True
+
+
+def test_configs_with_different_key_sets_use_their_own_fields(build):
+    interaction = build(_interaction(properties={
+        'state': {'key': 'state', 'output': 'state.json'},
+        'mode': {'title': 'Mode', 'forms': {'href': '/mode'}},
+    }))
+
+    properties = interaction.get_referable("properties")
+    state = properties.get_referable("state")
+    mode = properties.get_referable("mode")
+    assert [element.id_short for element in state.value] == ["Key", "output"]
+    assert [element.id_short for element in mode.value] == ["Title", "Forms"]
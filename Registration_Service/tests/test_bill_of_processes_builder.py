@@ -0,0 +1,127 @@
+"""Tests for the BillOfProcesses and Requirements submodel builders."""
+
+import pytest
+from basyx.aas import model
+
+from src.aas_generation.submodels.bill_of_processes_builder import (
+    BillOfProcessesSubmodelBuilder,
+    RequirementsSubmodelBuilder,
+)
+
+REQUIREMENTS = {
+    'Environmental': {
+        'Temperature': {'value': 20, 'unit': 'C', 'tolerance': 2},
+    },
+    'InProcessControl': {
+        'WeightCheck': {'rate': 10, 'unit': '%'},
+    },
+    'QualityControl': {
+        'VisualInspection': {'rate': 5, 'sampleSize': 3},
+    },
+}
+
+
+@pytest.fixture
+def build_processes(make_builder):
+    builder = make_builder(BillOfProcessesSubmodelBuilder)
+
+    def build_processes(processes):
+        return builder.build("productAAS", {'BillOfProcesses': {'Processes': processes}})
+    return build_processes
+
+
+@pytest.fixture
+def build(make_builder):
+    builder = make_builder(RequirementsSubmodelBuilder)
+
+    def build(requirements):
+        return builder.build("productAAS", {'Requirements': requirements})
+    return build
+
+
+def _structure(submodel):
+    return {
+        group.id_short: {
+            requirement.id_short: [
+                (element.id_short, element.value) for element in requirement.value
+            ]
+            for requirement in group.value
+        }
+        for group in submodel.submodel_element
+    }
+
+
+def test_requirements_without_empty_entries(build):
+    structure = _structure(build(REQUIREMENTS))
+
+    assert structure == {
+        'Environmental': {
+            'Temperature': [('Value', 20), ('Unit', 'C'), ('Tolerance', 2.0)],
+        },
+        'InProcessControl': {
+            'WeightCheck': [('Rate', 10.0), ('Unit', '%')],
+        },
+        'QualityControl': {
+            'VisualInspection': [('Rate', 5.0), ('SampleSize', 3)],
+        },
+    }
+
+
+def test_empty_requirement_entries_are_skipped(build):
+    requirements = {
+        group: {'Placeholder': {}, **entries, 'Trailing': {}}
+        for group, entries in REQUIREMENTS.items()
+    }
+
+    assert _structure(build(requirements)) == _structure(build(REQUIREMENTS))
+
+
+@pytest.mark.parametrize("value, value_type", [
+    (True, model.datatypes.Boolean),
+    (20, model.datatypes.Int),
+    (20.5, model.datatypes.Float),
+    ("dry", model.datatypes.String),
+])
+def test_requirement_value_type_follows_the_config_value(build, value, value_type):
+    submodel = build({'Environmental': {'Humidity': {'value': value}}})
+
+    humidity = submodel.get_referable("Environmental").get_referable("Humidity")
+    value_property = humidity.get_referable("Value")
+    assert value_property.value_type is value_type
+    assert value_property.value == value
+
+
+def test_group_of_only_empty_entries_is_an_empty_collection(build):
+    submodel = build({'Environmental': {'Placeholder': {}}})
+
+    environmental = submodel.get_referable("Environmental")
+    assert len(environmental.value) == 0
+
+
+def test_process_steps_do_not_share_display_names(build_processes):
+    submodel = build_processes([
+        {'Dispensing': {'step': 1}},
+        {'Dispensing': {'step': 2}},
+    ])
+
+    first, second = submodel.get_referable("Processes").value
+    first.display_name["de"] = "Dosieren"
+
+    assert first.display_name is not second.display_name
+    assert dict(second.display_name) == {"en": "Dispensing"}
+
+
+def test_repeated_configs_build_independent_submodels(make_builder, base_url):
+    builder = make_builder(BillOfProcessesSubmodelBuilder)
+    config = {'BillOfProcesses': {'Processes': [{'Dispensing': {'step': 1}}]}}
+
+    first = builder.build("firstAAS", config)
+    second = builder.build("secondAAS", config)
+
+    assert first.id == f"{base_url}/submodels/instances/firstAAS/BillOfProcesses"
+    assert second.id == f"{base_url}/submodels/instances/secondAAS/BillOfProcesses"
+    first_processes = first.get_referable("Processes")
+    second_processes = second.get_referable("Processes")
+    assert first_processes is not second_processes
+    assert first_processes.parent is first
+    assert second_processes.parent is second
@@ -0,0 +1,39 @@
+"""Tests for the OfferedCapabilityDescription submodel builder."""
+
+import pytest
+
+from src.aas_generation.submodels import CapabilitiesSubmodelBuilder
+
+
+@pytest.fixture
+def container(make_builder):
+    builder = make_builder(CapabilitiesSubmodelBuilder)
+
+    def container(properties):
+        submodel = builder.build("testAAS", {
+            'Capabilities': {'Dispensing': {'properties': properties}},
+        })
+        return submodel.get_referable("CapabilitySet").get_referable("DispensingContainer")
+    return container
+
+
+def _id_shorts(collection):
+    return [element.id_short for element in collection.value]
+
+
+def test_property_set_is_omitted_when_no_property_has_content(container):
+    dispensing = container([{'name': 'Volume'}, {'name': 'Speed', 'description': ''}])
+
+    assert _id_shorts(dispensing) == ["Dispensing"]
+
+
+def test_property_set_keeps_only_properties_with_content(container):
+    dispensing = container([
+        {'name': 'Volume', 'min': 1, 'max': 10},
+        {'name': 'Empty'},
+        {'name': 'Mode', 'value': 'auto', 'description': 'Dispensing mode'},
+    ])
+
+    property_set = dispensing.get_referable("PropertySet")
+    assert _id_shorts(property_set) == ["PropertyContainer_Volume", "PropertyContainer_Mode"]
+    assert _id_shorts(property_set.get_referable("PropertyContainer_Mode")) == ["Comment", "Mode"]
@@ -0,0 +1,23 @@
+"""Tests for the AAS element factory."""
+
+
+def test_multi_language_values_are_not_shared(element_factory):
+    first = element_factory.create_multi_language_property(id_short="A", text="Same text")
+    second = element_factory.create_multi_language_property(id_short="B", text="Same text")
+
+    first.value["de"] = "Gleicher Text"
+
+    assert first.value is not second.value
+    assert dict(second.value) == {"en": "Same text"}
+    third = element_factory.create_multi_language_property(id_short="C", text="Same text")
+    assert dict(third.value) == {"en": "Same text"}
+
+
+def test_descriptions_are_not_shared(element_factory):
+    first = element_factory.create_property(id_short="A", value="x", description="Same text")
+    second = element_factory.create_collection(id_short="B", elements=[], description="Same text")
+
+    first.description["de"] = "Gleicher Text"
+
+    assert first.description is not second.description
+    assert dict(second.description) == {"en": "Same text"}
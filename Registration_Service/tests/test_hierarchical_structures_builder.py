@@ -0,0 +1,14 @@
+"""Tests for the HierarchicalStructures submodel builder."""
+
+from src.aas_generation.submodels import HierarchicalStructuresSubmodelBuilder
+
+
+def test_default_display_names_are_not_shared(make_builder):
+    builder = make_builder(HierarchicalStructuresSubmodelBuilder)
+    first = builder.build("firstAAS", {})
+    second = builder.build("secondAAS", {})
+
+    first.display_name["de"] = "Hierarchie"
+
+    assert first.display_name is not second.display_name
+    assert dict(second.display_name) == {"en": "HierarchicalStructures"}
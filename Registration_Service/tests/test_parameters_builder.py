@@ -0,0 +1,41 @@
+"""Tests for the Parameters submodel builder."""
+
+from basyx.aas import model
+
+from src.aas_generation.submodels import ParametersSubmodelBuilder
+
+SCHEMA_FIELDS = {
+    'https://example.com/schemas/speed.json': {
+        'Speed': {'aas_type': model.datatypes.Double, 'default_value': 1.0},
+    },
+    'https://example.com/schemas/mode.json': {
+        'Mode': {'aas_type': model.datatypes.String, 'default_value': 'auto'},
+    },
+}
+
+
+class FakeSchemaHandler:
+    """Schema handler serving fixed data fields by schema URL."""
+
+    def extract_data_fields(self, schema_url):
+        return SCHEMA_FIELDS.get(schema_url, {})
+
+
+def _field_names(submodel, param_name):
+    return [
+        element.id_short for element in submodel.get_referable(param_name).value
+        if isinstance(element, model.Property)
+    ]
+
+
+def test_changed_properties_list_is_used_on_the_next_build(make_builder):
+    builder = make_builder(ParametersSubmodelBuilder, schema_handler=FakeSchemaHandler())
+    config = {'Parameters': {'Setpoint': {'InterfaceReference': 'setpoint'}}}
+    properties = [{'name': 'setpoint', 'schema': 'https://example.com/schemas/speed.json'}]
+
+    first = builder.build("testAAS", config, properties)
+    properties[0] = {'name': 'setpoint', 'schema': 'https://example.com/schemas/mode.json'}
+    second = builder.build("testAAS", config, properties)
+
+    assert _field_names(first, "Setpoint") == ["Speed"]
+    assert _field_names(second, "Setpoint") == ["Mode"]
@@ -0,0 +1,47 @@
+"""Tests for the Process AAS submodel builders."""
+
+import pytest
+
+from src.aas_generation.submodels import (
+    PolicySubmodelBuilder,
+    ProcessInformationSubmodelBuilder,
+    RequiredCapabilitiesSubmodelBuilder,
+)
+
+CONFIG = {
+    'ProcessInformation': {'ProcessName': "Filling", 'Status': "planned"},
+    'RequiredCapabilities': {
+        'Loading': {
+            'description': "Load container onto shuttle",
+            'resources': {'loader': "https://example.com/aas/loadingSystemAAS"},
+        },
+    },
+    'Policy': {'Policy': {'File': "https://example.com/policy/production.xml"}},
+}
+
+
+@pytest.mark.parametrize("builder_cls, id_short", [
+    (ProcessInformationSubmodelBuilder, "ProcessInformation"),
+    (RequiredCapabilitiesSubmodelBuilder, "RequiredCapabilities"),
+    (PolicySubmodelBuilder, "Policy"),
+])
+def test_non_string_system_id(make_builder, base_url, builder_cls, id_short):
+    builder = make_builder(builder_cls)
+
+    submodel = builder.build(1001, CONFIG)
+
+    assert submodel.id == f"{base_url}/submodels/instances/1001/{id_short}"
+
+
+def test_capability_reference_from_aas_id(make_builder, base_url):
+    builder = make_builder(RequiredCapabilitiesSubmodelBuilder)
+
+    submodel = builder.build("processAAS", CONFIG)
+
+    reference = submodel.get_referable("Loading").get_referable("References").get_referable("loader")
+    assert [key.value for key in reference.value.key] == [
+        f"{base_url}/submodels/instances/loadingSystemAAS/OfferedCapabilityDescription",
+        "CapabilitySet",
+        "LoadingContainer",
+        "Loading",
+    ]
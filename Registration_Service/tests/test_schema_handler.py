@@ -0,0 +1,35 @@
+"""Tests for the schema handler."""
+
+from src.aas_generation.schema_handler import SchemaHandler
+
+SCHEMA_URL = "https://example.com/schemas/speed.json"
+
+SCHEMA = {
+    'properties': {'Speed': {'type': 'number'}, 'TimeStamp': {'type': 'string'}},
+    'required': ['Speed', 'TimeStamp'],
+}
+
+
+def _handler(schemas):
+    """Create a handler whose loads return the given schemas in order."""
+    handler = SchemaHandler()
+    loads = iter(schemas)
+    handler.load_schema = lambda schema_url: next(loads)
+    return handler
+
+
+def test_failed_load_is_not_cached():
+    handler = _handler([None, SCHEMA])
+
+    assert handler.extract_data_fields(SCHEMA_URL) == {}
+    assert list(handler.extract_data_fields(SCHEMA_URL)) == ["Speed"]
+
+
+def test_data_fields_are_cached_until_cleared():
+    handler = _handler([SCHEMA, {'properties': {}, 'required': []}])
+
+    first = handler.extract_data_fields(SCHEMA_URL)
+    assert handler.extract_data_fields(SCHEMA_URL) is first
+
+    handler.clear_cache()
+    assert handler.extract_data_fields(SCHEMA_URL) == {}
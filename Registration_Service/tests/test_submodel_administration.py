@@ -0,0 +1,38 @@
+"""Tests for the administration info of built submodels."""
+
+import pytest
+
+from src.aas_generation.submodels import (
+    AssetInterfacesBuilder,
+    CapabilitiesSubmodelBuilder,
+    HierarchicalStructuresSubmodelBuilder,
+    ParametersSubmodelBuilder,
+    PolicySubmodelBuilder,
+    ProcessInformationSubmodelBuilder,
+    RequiredCapabilitiesSubmodelBuilder,
+)
+
+BUILDERS = [
+    (AssetInterfacesBuilder, {}, ("1", "0")),
+    (CapabilitiesSubmodelBuilder, {}, ("1", "0")),
+    (HierarchicalStructuresSubmodelBuilder, {}, ("1", "1")),
+    (ParametersSubmodelBuilder, {}, ("1", "0")),
+    (ProcessInformationSubmodelBuilder,
+     {'ProcessInformation': {'ProcessName': "Filling"}}, ("1", "0")),
+    (RequiredCapabilitiesSubmodelBuilder,
+     {'RequiredCapabilities': {'Loading': {'description': "Load"}}}, ("1", "0")),
+    (PolicySubmodelBuilder,
+     {'Policy': {'Policy': {'File': "policy.xml"}}}, ("1", "0")),
+]
+
+
+@pytest.mark.parametrize("builder_cls, config, version", BUILDERS)
+def test_submodels_do_not_share_administration(make_builder, builder_cls, config, version):
+    builder = make_builder(builder_cls)
+    first = builder.build("firstAAS", config)
+    second = builder.build("secondAAS", config)
+
+    first.administration.version = "2"
+
+    assert first.administration is not second.administration
+    assert (second.administration.version, second.administration.revision) == version